@@ -2,259 +2,1196 @@
 # /// script
 # requires-python = ">=3.12"
 # dependencies = [
+#     "pymupdf>=1.27.2.3",
 #     "pyqt5>=5.15.11",
 # ]
 # ///
+import argparse
+import math
+import multiprocessing
 import os
+import shutil
+import subprocess
 import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
 from pathlib import Path
+from typing import NamedTuple
 
-from PyQt5.QtWidgets import (
-    QApplication,
-    QMainWindow,
-    QWidget,
-    QVBoxLayout,
-    QHBoxLayout,
-    QLabel,
-    QLineEdit,
-    QPushButton,
-    QComboBox,
-    QProgressBar,
-    QMessageBox,
-    QFileDialog,
-)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont
-
-
-class PDFConverterWorker(QThread):
-    progress_update = pyqtSignal(int)
-    status_update = pyqtSignal(str, bool)  # text, is_error
-    conversion_complete = pyqtSignal(bool, str)  # success, output_path
-
-    def __init__(self, input_file, density):
-        super().__init__()
-        self.input_file = input_file
-        self.density = density
-
-    def run(self):
-        input_path = Path(self.input_file)
-        density = self.density
-
-        # Validate input file exists
-        if not input_path.exists():
-            self.status_update.emit("Error: Input file does not exist.", True)
-            self.conversion_complete.emit(False, "")
+try:
+    import pymupdf
+except ImportError:  # Only the ImageMagick engine is available
+    pymupdf = None
+
+
+JPEG_QUALITY = 92  # ImageMagick's default when it can't infer a quality
+CHUNK_PAGES = 16  # pages per chunk when converting across worker processes
+POLL_INTERVAL = 0.25  # seconds between progress and cancellation checks
+
+# Page classification: pages that wouldn't shrink are copied through as-is
+PAGE_RASTERIZE = "rasterize"
+PAGE_PASSTHROUGH = "passthrough"
+VECTOR_RASTERIZE_BYTES = 512 * 1024  # content streams this big are worth rasterizing
+LOW_RES_TOLERANCE = 1.1  # JPEGs up to this much above the density count as low-res
+JPEG_PAGE_BYTES_PER_PIXEL = 0.15  # rough size of a rasterized page per pixel
+
+# Target size search: densities and JPEG qualities probed on sampled pages
+MIN_DENSITY = 50
+MIN_QUALITY = 20
+TARGET_QUALITY = 75  # preferred quality floor before giving up resolution
+SIZE_SAMPLE_PAGES = 8
+PAGE_OVERHEAD_BYTES = 400  # page, image and xref objects around each JPEG
+SIZE_SAFETY_MARGIN = 0.95  # aim below the target since samples are estimates
+PIXMAP_CACHE_BYTES = 256 * 1024 * 1024  # sampled page rasters kept for re-encoding
+
+RAM_TEMP_ROOT = "/dev/shm"
+RAM_TEMP_MAX_FRACTION = 0.5  # share of free RAM-disk space one job may claim
+JPEG_BYTES_PER_PIXEL = 0.5  # rough size of an intermediate JPEG per pixel
+
+ENGINE_PYMUPDF = "pymupdf"
+ENGINE_IMAGEMAGICK = "imagemagick"
+ENGINES = [ENGINE_PYMUPDF, ENGINE_IMAGEMAGICK] if pymupdf else [ENGINE_IMAGEMAGICK]
+DEFAULT_ENGINE = ENGINES[0]
+
+
+class ConversionError(Exception):
+    """Raised when a conversion step fails with a user-facing message."""
+
+
+class ConversionCancelled(ConversionError):
+    """Raised when a conversion stops because cancellation was requested."""
+
+    def __init__(self):
+        super().__init__("Conversion cancelled.")
+
+
+class ProgressTracker:
+    """Turn pages done into progress messages with throughput and ETA."""
+
+    def __init__(self, total, progress):
+        self.total = total
+        self.progress = progress
+        self.start = time.monotonic()
+
+    def update(self, done):
+        if not self.progress:
             return
+        elapsed = time.monotonic() - self.start
+        message = f"Page {done}/{self.total}"
+        if done and elapsed > 0:
+            rate = done / elapsed
+            eta = (self.total - done) / rate
+            message += f" - {rate:.1f} pages/s, ETA {eta:.0f}s"
+        self.progress(done, self.total, message)
+
+
+# Shared with chunk worker processes through the pool initializer
+_chunk_cancel = None
+_chunk_pages_done = None
+
+
+def _init_chunk_worker(cancel_event, pages_done):
+    global _chunk_cancel, _chunk_pages_done
+    _chunk_cancel = cancel_event
+    _chunk_pages_done = pages_done
+
+
+def page_resolution(page):
+    """Return the resolution in DPI that ``page``'s content already has.
+
+    Only the page's content stream size and image metadata are inspected,
+    nothing is rendered. Pages without images are text or vector content
+    that a JPEG round trip makes bigger and blurrier, so they count as 0,
+    unless their content is large enough to be cheaper as an image.
+
+    JPEGs count at their highest effective DPI. Other images, e.g. Flate,
+    JBIG2 or CCITT scans, count at the break-even density: the one at which
+    a JPEG of the whole page would be as big as their stored streams, so
+    compact bilevel scans are only rasterized at low densities. Inline
+    images count with the content stream that holds them.
+    """
+    images = page.get_image_info(xrefs=True)
+    if not images:
+        if len(page.read_contents()) > VECTOR_RASTERIZE_BYTES:
+            return math.inf
+        return 0
+
+    doc = page.parent
+    resolution = 0
+    stored = {}  # image xref, or 0 for the content stream -> stored bytes
+    for info in images:
+        xref = info["xref"]
+        if not xref:  # inline image
+            stored[0] = len(page.read_contents())
+            continue
+        _, image_filter = doc.xref_get_key(xref, "Filter")
+        if "DCTDecode" not in image_filter:
+            stored[xref] = len(doc.xref_stream_raw(xref) or b"")
+            continue
+        bbox = pymupdf.Rect(info["bbox"])
+        if bbox.is_empty:
+            continue
+        resolution = max(
+            resolution,
+            info["width"] * 72 / bbox.width,
+            info["height"] * 72 / bbox.height,
+        )
+    if stored and not page.rect.is_empty:
+        page_pixels = page.rect.width * page.rect.height / 72**2  # at 1 DPI
+        resolution = max(
+            resolution,
+            math.sqrt(sum(stored.values()) / (page_pixels * JPEG_PAGE_BYTES_PER_PIXEL)),
+        )
+    return resolution
+
+
+def classify_page(page, density):
+    """Decide whether rasterizing ``page`` at ``density`` is worthwhile.
+
+    Pages whose ``page_resolution`` is at or below ``density`` would only be
+    recompressed, or made bigger and blurrier, for no gain.
+
+    Returns:
+        ``PAGE_RASTERIZE`` or ``PAGE_PASSTHROUGH``.
+    """
+    if page_resolution(page) > int(density) * LOW_RES_TOLERANCE:
+        return PAGE_RASTERIZE
+    return PAGE_PASSTHROUGH
+
+
+def _append_page(out, page, density, quality, passthrough=False):
+    """Append ``page`` to ``out`` as a single JPEG image.
+
+    With ``passthrough``, pages that ``classify_page`` says wouldn't shrink
+    are copied unchanged instead. Copies keep ``out``'s graft map of
+    ``page.parent``, so fonts and images shared between pages are copied
+    once rather than once per page.
+
+    Returns:
+        ``PAGE_RASTERIZE`` or ``PAGE_PASSTHROUGH``, whichever was done.
+    """
+    if passthrough and classify_page(page, density) == PAGE_PASSTHROUGH:
+        out.insert_pdf(
+            page.parent, from_page=page.number, to_page=page.number, final=False
+        )
+        return PAGE_PASSTHROUGH
+
+    pix = page.get_pixmap(dpi=int(density))
+    jpeg = pix.tobytes(output="jpeg", jpg_quality=quality)
+    new_page = out.new_page(width=page.rect.width, height=page.rect.height)
+    new_page.insert_image(new_page.rect, stream=jpeg)
+    return PAGE_RASTERIZE
+
+
+def _convert_chunk(input_path, start, stop, density, quality, passthrough):
+    """Convert pages ``start`` to ``stop - 1`` into a standalone PDF in memory.
+
+    Runs inside a worker process, so only one page raster exists at a time
+    and only the compressed chunk is sent back. Each finished page bumps the
+    shared page counter, and the chunk is abandoned between pages once the
+    shared cancel event is set.
+
+    Returns:
+        Tuple of ``(pdf_bytes, pages_passed_through)``, or None if cancelled.
+    """
+    with pymupdf.open(input_path) as src, pymupdf.open() as out:
+        kept = 0
+        for page_number in range(start, stop):
+            if _chunk_cancel is not None and _chunk_cancel.is_set():
+                return None
+            action = _append_page(out, src[page_number], density, quality, passthrough)
+            kept += action == PAGE_PASSTHROUGH
+            if _chunk_pages_done is not None:
+                with _chunk_pages_done.get_lock():
+                    _chunk_pages_done.value += 1
+        return out.tobytes(garbage=4, deflate=True), kept
+
+
+def convert_with_pymupdf(
+    input_path,
+    output_path,
+    density,
+    quality=JPEG_QUALITY,
+    progress=None,
+    workers=1,
+    chunk_pages=CHUNK_PAGES,
+    passthrough=False,
+    cancelled=None,
+):
+    """Rasterize every page in process and rebuild the PDF from JPEGs.
+
+    Pages are rendered at ``density`` DPI, encoded as JPEG in memory and
+    placed on pages of the original size, so nothing touches disk except
+    the output file. With several workers the document is split into
+    chunks of ``chunk_pages`` pages that are converted in separate
+    processes and stitched together in order. At most one chunk per worker
+    is in flight, which bounds memory to ``workers`` page rasters plus the
+    compressed chunks waiting to be stitched.
+
+    Args:
+        input_path: Path to the input PDF.
+        output_path: Path to write the converted PDF to.
+        density: Render resolution in dots per inch.
+        quality: JPEG quality (0-100).
+        progress: Optional ``progress(done, total, message)`` callback.
+        workers: Number of worker processes.
+        chunk_pages: Pages per chunk when using worker processes.
+        passthrough: Copy pages that wouldn't shrink through unchanged.
+        cancelled: Optional callable; once it returns True the conversion
+            stops between pages and raises ``ConversionCancelled``.
+
+    Returns:
+        Number of pages copied through unchanged.
+
+    Raises:
+        ConversionCancelled: If ``cancelled`` returned True.
+    """
+    kept = 0
+    with pymupdf.open(input_path) as src, pymupdf.open() as out:
+        total = src.page_count
+        tracker = ProgressTracker(total, progress)
+        if workers <= 1 or total <= chunk_pages:
+            for page in src:
+                if cancelled and cancelled():
+                    raise ConversionCancelled()
+                tracker.update(page.number)
+                action = _append_page(out, page, density, quality, passthrough)
+                kept += action == PAGE_PASSTHROUGH
+        else:
+            chunks = deque(
+                (start, min(start + chunk_pages, total))
+                for start in range(0, total, chunk_pages)
+            )
+            cancel_event = multiprocessing.Event()
+            pages_done = multiprocessing.Value("i", 0)
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_chunk_worker,
+                initargs=(cancel_event, pages_done),
+            )
+            try:
+                in_flight = deque()
+                while chunks or in_flight:
+                    # Keep every worker busy plus one chunk ready to stitch
+                    while chunks and len(in_flight) <= workers:
+                        start, stop = chunks.popleft()
+                        future = executor.submit(
+                            _convert_chunk,
+                            str(input_path),
+                            start,
+                            stop,
+                            density,
+                            quality,
+                            passthrough,
+                        )
+                        in_flight.append((stop, future))
+                    stop, future = in_flight[0]
+                    # Report pages as workers finish them while waiting
+                    while not wait([future], timeout=POLL_INTERVAL).done:
+                        if cancelled and cancelled():
+                            cancel_event.set()
+                            raise ConversionCancelled()
+                        tracker.update(pages_done.value)
+                    in_flight.popleft()
+                    chunk_bytes, chunk_kept = future.result()
+                    kept += chunk_kept
+                    with pymupdf.open("pdf", chunk_bytes) as chunk:
+                        out.insert_pdf(chunk)
+                    tracker.update(pages_done.value)
+            finally:
+                # Drop queued chunks; running ones stop at their next page
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        if progress:
+            message = "Creating output PDF..."
+            if passthrough:
+                message = f"Creating output PDF ({kept} of {total} pages kept as-is)..."
+            progress(total, total, message)
+        # garbage=4 also merges the copies of shared resources each chunk made
+        out.save(output_path, garbage=4, deflate=True)
+    return kept
+
+
+class SizeEstimator:
+    """Predict the pymupdf engine's output size from a sample of pages.
+
+    Sampled pages are rendered at one density at a time. Their rasters are
+    kept, up to ``PIXMAP_CACHE_BYTES``, so probing other qualities at that
+    density only re-encodes them; past that limit pages are rendered one at
+    a time. Encoded sizes are kept per density and quality, so repeated
+    probes are free.
+
+    With ``passthrough``, pages that would be copied through as-is count at
+    their copied size and only the pages that would be rasterized are
+    sampled.
+    """
+
+    def __init__(self, doc, sample_pages=SIZE_SAMPLE_PAGES, passthrough=False):
+        self.doc = doc
+        self.sample_pages = sample_pages
+        self.resolutions = None
+        if passthrough:
+            self.resolutions = [page_resolution(page) for page in doc]
+        self.kept_sizes = {}  # passthrough page numbers -> copied bytes
+        self.sizes = {}  # (density, quality) -> predicted bytes
+        self.pixmap_density = None
+        self.pixmaps = {}  # sampled page number -> raster at pixmap_density
+        self.probes = 0
+
+    def split(self, density):
+        """Return the page numbers rasterized and kept as-is at ``density``."""
+        pages = range(self.doc.page_count)
+        if self.resolutions is None:
+            return list(pages), ()
+        limit = int(density) * LOW_RES_TOLERANCE
+        rasterized = [n for n in pages if self.resolutions[n] > limit]
+        kept = tuple(n for n in pages if self.resolutions[n] <= limit)
+        return rasterized, kept
+
+    def kept_size(self, kept):
+        """Return the size in bytes of the pages ``kept`` copied on their own."""
+        if not kept:
+            return 0
+        if kept not in self.kept_sizes:
+            with pymupdf.open() as out:
+                for n in kept:
+                    out.insert_pdf(self.doc, from_page=n, to_page=n, final=False)
+                self.kept_sizes[kept] = len(out.tobytes(garbage=4, deflate=True))
+        return self.kept_sizes[kept]
+
+    def pixmap(self, page_number, density):
+        """Return page ``page_number`` rendered at ``density``, cached if it fits."""
+        if density != self.pixmap_density:
+            self.pixmap_density = density
+            self.pixmaps = {}
+        pix = self.pixmaps.get(page_number)
+        if pix is None:
+            pix = self.doc[page_number].get_pixmap(dpi=density)
+            cached = sum(cached_pix.size for cached_pix in self.pixmaps.values())
+            if cached + pix.size <= PIXMAP_CACHE_BYTES:
+                self.pixmaps[page_number] = pix
+        return pix
+
+    def predict(self, density, quality):
+        """Return the predicted output size in bytes at these settings."""
+        if (density, quality) not in self.sizes:
+            self.probes += 1
+            rasterized, kept = self.split(density)
+            size = self.kept_size(kept)
+            count = min(self.sample_pages, len(rasterized))
+            if count:
+                step = len(rasterized) / count
+                sample = [rasterized[int(i * step)] for i in range(count)]
+                sampled = sum(
+                    len(
+                        self.pixmap(n, density).tobytes(
+                            output="jpeg", jpg_quality=quality
+                        )
+                    )
+                    for n in sample
+                )
+                size += (
+                    sampled * len(rasterized) // count
+                    + len(rasterized) * PAGE_OVERHEAD_BYTES
+                )
+            self.sizes[density, quality] = size
+        return self.sizes[density, quality]
+
+
+def _highest_fitting(low, high, fits):
+    """Binary search the highest value in ``[low, high]`` for which ``fits`` holds.
+
+    Returns:
+        The value found, or None if even ``low`` doesn't fit.
+    """
+    if not fits(low):
+        return None
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits(middle):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def choose_settings_for_size(
+    input_path, target_size, max_density=600, passthrough=False
+):
+    """Pick the density and JPEG quality that fit the output in ``target_size``.
+
+    Resolution is preferred over quality: the highest density that fits at
+    ``TARGET_QUALITY`` is found first, then quality is raised as far as the
+    remaining budget allows. If nothing fits at ``MIN_DENSITY``, quality is
+    lowered instead, down to ``MIN_QUALITY``. The quality search reuses the
+    sampled pages' rasters, so it costs only JPEG encodes.
+
+    With ``passthrough``, pages copied through as-is count at their copied
+    size, so a target below that can only be met by rasterizing every page.
+
+    Args:
+        input_path: Path to the input PDF.
+        target_size: Output size limit in bytes.
+        max_density: Highest density to consider.
+        passthrough: Whether the conversion copies pages that wouldn't
+            shrink through unchanged.
+
+    Returns:
+        Tuple of ``(density, quality, predicted_size)``.
+
+    Raises:
+        ConversionError: If even ``MIN_DENSITY`` and ``MIN_QUALITY`` are
+            predicted to exceed ``target_size``; the message gives the
+            smallest achievable size.
+    """
+    budget = target_size * SIZE_SAFETY_MARGIN
+    max_density = max(MIN_DENSITY, int(max_density))
+    with pymupdf.open(input_path) as doc:
+        estimator = SizeEstimator(doc, passthrough=passthrough)
+
+        density = _highest_fitting(
+            MIN_DENSITY,
+            max_density,
+            lambda d: estimator.predict(d, TARGET_QUALITY) <= budget,
+        )
+        if density is not None:
+            quality = _highest_fitting(
+                TARGET_QUALITY,
+                JPEG_QUALITY,
+                lambda q: estimator.predict(density, q) <= budget,
+            )
+        else:
+            density = MIN_DENSITY
+            quality = _highest_fitting(
+                MIN_QUALITY,
+                TARGET_QUALITY,
+                lambda q: estimator.predict(density, q) <= budget,
+            )
+            if quality is None:
+                smallest = estimator.predict(density, MIN_QUALITY)
+                if smallest > target_size:
+                    raise ConversionError(
+                        f"Error: Target size of {target_size / 1024 / 1024:.2f} MB "
+                        f"is unreachable, the smallest achievable is about "
+                        f"{smallest / 1024 / 1024:.2f} MB."
+                    )
+                quality = MIN_QUALITY  # within the safety margin
+
+        return density, quality, estimator.predict(density, quality)
+
+
+def estimate_workspace_bytes(input_path, density):
+    """Estimate the size of the intermediate JPEGs for the ImageMagick engine.
+
+    Returns:
+        Estimated size in bytes, or None if pymupdf isn't available to read
+        the page sizes.
+    """
+    if pymupdf is None:
+        return None
+    pixels = 0
+    with pymupdf.open(input_path) as doc:
+        for page in doc:
+            scale = int(density) / 72
+            pixels += page.rect.width * scale * page.rect.height * scale
+    return int(pixels * JPEG_BYTES_PER_PIXEL)
+
+
+def create_workspace(input_path, density, use_ram=False):
+    """Create a private temporary directory for one conversion job.
+
+    With ``use_ram`` the directory is placed on the RAM-backed
+    ``RAM_TEMP_ROOT`` when the job's estimated intermediates fit within
+    ``RAM_TEMP_MAX_FRACTION`` of its free space, otherwise on disk.
+
+    Returns:
+        Path of the new directory. The caller is responsible for removing it.
+    """
+    temp_root = None
+    if use_ram and os.path.isdir(RAM_TEMP_ROOT):
+        estimate = estimate_workspace_bytes(input_path, density)
+        free = shutil.disk_usage(RAM_TEMP_ROOT).free
+        if estimate is not None and estimate <= free * RAM_TEMP_MAX_FRACTION:
+            temp_root = RAM_TEMP_ROOT
+    return tempfile.mkdtemp(prefix="convert_pdf_", dir=temp_root)
 
-        # Create output file path
-        output_path = input_path.with_name(f"{input_path.stem}_converted.pdf")
 
-        # Update progress
-        self.progress_update.emit(10)
-        self.status_update.emit("Processing PDF...")
+def _run_magick(args, cancelled=None):
+    """Run ``magick`` with ``args``, killing it if cancellation is requested.
 
+    Returns:
+        The process exit code.
+
+    Raises:
+        ConversionCancelled: If ``cancelled`` returned True while it ran.
+    """
+    try:
+        process = subprocess.Popen(["magick", *args])
+    except FileNotFoundError:
+        return 127
+    while True:
         try:
-            # Create temporary directory
-            temp_dir = "/tmp/convert_pdf"
-            os.makedirs(temp_dir, exist_ok=True)
+            return process.wait(timeout=POLL_INTERVAL)
+        except subprocess.TimeoutExpired:
+            if cancelled and cancelled():
+                process.kill()
+                process.wait()
+                raise ConversionCancelled()
+
+
+def convert_with_imagemagick(
+    input_path, output_path, density, temp_dir, progress=None, cancelled=None
+):
+    """Convert the PDF through JPEG files on disk using two ``magick`` calls.
+
+    Args:
+        input_path: Path to the input PDF.
+        output_path: Path to write the converted PDF to.
+        density: Render resolution in dots per inch.
+        temp_dir: Private directory for the intermediate JPEG files.
+        progress: Optional ``progress(done, total, message)`` callback.
+        cancelled: Optional callable; once it returns True the running
+            ``magick`` process is killed and ``ConversionCancelled`` raised.
+
+    Raises:
+        ConversionError: If either ``magick`` call fails.
+    """
+    temp_file_pattern = os.path.join(temp_dir, "page-%d.jpg")
+
+    # Step 1: Convert PDF to images with specified density
+    args1 = ["-density", str(density), str(input_path), temp_file_pattern]
+    if _run_magick(args1, cancelled) != 0:
+        raise ConversionError(f"Error converting {Path(input_path).name} to images")
+
+    if progress:
+        progress(1, 2, "Creating output PDF...")
+
+    # Step 2: Combine the images back into a PDF
+    temp_images_pattern = os.path.join(temp_dir, "page-*.jpg")
+    # Name the format, since the output path needn't end in .pdf
+    if _run_magick([temp_images_pattern, f"pdf:{output_path}"], cancelled) != 0:
+        raise ConversionError("Error creating PDF from images")
+
+
+def cleanup_workspace(temp_dir):
+    """Remove a job's temporary directory"""
+    try:
+        if temp_dir and os.path.exists(temp_dir):
+            shutil.rmtree(temp_dir)
+    except Exception as e:
+        print(f"Warning: Could not clean up temporary files: {str(e)}")
+
+
+def output_path_for(input_path, output_dir=None):
+    """Return where the converted copy of ``input_path`` is written."""
+    input_path = Path(input_path)
+    directory = Path(output_dir) if output_dir else input_path.parent
+    return directory / f"{input_path.stem}_converted.pdf"
+
+
+def convert_pdf_file(
+    input_path,
+    output_path,
+    density,
+    engine=DEFAULT_ENGINE,
+    workers=1,
+    use_ram=False,
+    progress=None,
+    target_size=None,
+    passthrough=False,
+    cancelled=None,
+):
+    """Convert one PDF with the chosen engine.
+
+    Args:
+        input_path: Path to the input PDF.
+        output_path: Path to write the converted PDF to.
+        density: Render resolution in dots per inch.
+        engine: ``ENGINE_PYMUPDF`` or ``ENGINE_IMAGEMAGICK``.
+        workers: Worker processes for the pymupdf engine.
+        use_ram: Put the ImageMagick engine's workspace on a RAM disk if it fits.
+        progress: Optional ``progress(done, total, message)`` callback.
+        target_size: Aim for an output of at most this many bytes by choosing
+            the density (up to ``density``) and JPEG quality automatically.
+            Requires the pymupdf engine.
+        passthrough: Copy pages that wouldn't shrink through unchanged
+            instead of rasterizing them. Ignored by the ImageMagick engine.
+        cancelled: Optional callable polled during the conversion; once it
+            returns True the work stops and any partial output is removed.
+            An earlier file at ``output_path`` is only replaced on success.
+
+    Raises:
+        ConversionCancelled: If ``cancelled`` returned True.
+        ConversionError: If the input is missing, ``target_size`` is
+            unreachable or a conversion step fails.
+    """
+    if not Path(input_path).exists():
+        raise ConversionError("Error: Input file does not exist.")
+
+    if target_size and engine != ENGINE_PYMUPDF:
+        raise ConversionError("Error: Target size requires the pymupdf engine.")
+
+    # Write beside the output and move it into place only once complete, so
+    # a failed or cancelled run never touches an earlier output
+    output_path = Path(output_path)
+    partial_path = output_path.with_name(f".{output_path.name}.partial")
+    try:
+        if engine == ENGINE_PYMUPDF:
+            quality = JPEG_QUALITY
+            if target_size:
+                if progress:
+                    progress(0, 1, "Estimating settings for target size...")
+                density, quality, predicted = choose_settings_for_size(
+                    input_path, target_size, density, passthrough
+                )
+                if progress:
+                    progress(
+                        0,
+                        1,
+                        f"Using {density} DPI at quality {quality} "
+                        f"(predicted {predicted / 1024 / 1024:.1f} MB)",
+                    )
+            convert_with_pymupdf(
+                input_path,
+                partial_path,
+                density,
+                quality,
+                progress=progress,
+                workers=workers,
+                passthrough=passthrough,
+                cancelled=cancelled,
+            )
+        else:
+            temp_dir = create_workspace(input_path, density, use_ram)
+            try:
+                convert_with_imagemagick(
+                    input_path,
+                    partial_path,
+                    density,
+                    temp_dir,
+                    progress=progress,
+                    cancelled=cancelled,
+                )
+            finally:
+                cleanup_workspace(temp_dir)
+        os.replace(partial_path, output_path)
+    finally:
+        partial_path.unlink(missing_ok=True)
 
-            # Generate a unique temporary file name
-            import uuid
 
-            temp_base_name = f"temp_{uuid.uuid4().hex}"
-            temp_file_pattern = os.path.join(temp_dir, f"{temp_base_name}-%d.jpg")
+def setup_gui():
+    """Set up and return the PyQt5 GUI components."""
+    from PyQt5.QtWidgets import (
+        QApplication,
+        QCheckBox,
+        QComboBox,
+        QDoubleSpinBox,
+        QFileDialog,
+        QHBoxLayout,
+        QLabel,
+        QLineEdit,
+        QMainWindow,
+        QMessageBox,
+        QProgressBar,
+        QPushButton,
+        QSpinBox,
+        QVBoxLayout,
+        QWidget,
+    )
+    from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
+    from PyQt5.QtGui import QFont
 
-            # Step 1: Convert PDF to images with specified density
-            cmd1 = f'magick -density {density} "{input_path}" "{temp_file_pattern}"'
-            result1 = os.system(cmd1)
+    class PDFConverterWorker(QThread):
+        progress_update = pyqtSignal(int)
+        status_update = pyqtSignal(str, bool)  # text, is_error
+        conversion_complete = pyqtSignal(bool, str)  # success, output_path
 
-            if result1 != 0:
+        def __init__(
+            self,
+            input_file,
+            density,
+            engine=DEFAULT_ENGINE,
+            workers=1,
+            use_ram=False,
+            target_size=None,
+            passthrough=False,
+        ):
+            super().__init__()
+            self.input_file = input_file
+            self.density = density
+            self.engine = engine
+            self.workers = workers
+            self.use_ram = use_ram
+            self.target_size = target_size
+            self.passthrough = passthrough
+
+        def report_progress(self, done, total, message):
+            """Map engine progress onto the 10-90% range of the progress bar"""
+            if total:
+                self.progress_update.emit(10 + 80 * done // total)
+            self.status_update.emit(message, False)
+
+        def run(self):
+            input_path = Path(self.input_file)
+            output_path = output_path_for(input_path)
+
+            # Update progress
+            self.progress_update.emit(10)
+            self.status_update.emit("Processing PDF...", False)
+
+            try:
+                convert_pdf_file(
+                    input_path,
+                    output_path,
+                    self.density,
+                    self.engine,
+                    self.workers,
+                    self.use_ram,
+                    progress=self.report_progress,
+                    target_size=self.target_size,
+                    passthrough=self.passthrough,
+                    cancelled=self.isInterruptionRequested,
+                )
+
+                # Conversion successful
+                self.progress_update.emit(100)
                 self.status_update.emit(
-                    f"Error converting {input_path.name} to images", True
+                    f"Successfully converted to {output_path.name}", False
                 )
-                # Clean up temp directory
-                self.cleanup_temp_files(temp_dir)
+
+                self.conversion_complete.emit(True, str(output_path))
+
+            except ConversionCancelled as e:
+                self.status_update.emit(str(e), False)
+                self.conversion_complete.emit(False, "")
+            except ConversionError as e:
+                self.status_update.emit(str(e), True)
+                self.conversion_complete.emit(False, "")
+            except Exception as e:
+                self.status_update.emit(f"An error occurred: {str(e)}", True)
                 self.conversion_complete.emit(False, "")
-                return
 
-            self.progress_update.emit(50)
-            self.status_update.emit("Creating output PDF...")
+    class PDFConverterGUI(QMainWindow):
+        def __init__(self):
+            super().__init__()
+            self.setWindowTitle("PDF Converter")
+            self.setGeometry(100, 100, 600, 400)
 
-            # Step 2: Combine the images back into a PDF
-            temp_images_pattern = os.path.join(temp_dir, f"{temp_base_name}-*.jpg")
-            cmd2 = f'magick "{temp_images_pattern}" "{output_path}"'
-            result2 = os.system(cmd2)
+            # Central widget
+            central_widget = QWidget()
+            self.setCentralWidget(central_widget)
 
-            if result2 != 0:
-                self.status_update.emit("Error creating PDF from images", True)
-                # Clean up temp directory
-                self.cleanup_temp_files(temp_dir)
-                self.conversion_complete.emit(False, "")
+            # Main layout
+            main_layout = QVBoxLayout(central_widget)
+            main_layout.setContentsMargins(20, 20, 20, 20)
+
+            # Input file selection
+            input_label = QLabel("Input PDF File:")
+            input_label.setFont(QFont("Arial", 10))
+            main_layout.addWidget(input_label)
+
+            input_hbox = QHBoxLayout()
+            self.input_line_edit = QLineEdit()
+            self.browse_button = QPushButton("Browse")
+            self.browse_button.clicked.connect(self.browse_file)
+            input_hbox.addWidget(self.input_line_edit)
+            input_hbox.addWidget(self.browse_button)
+            main_layout.addLayout(input_hbox)
+
+            # Density setting
+            density_label = QLabel("Density (DPI):")
+            density_label.setFont(QFont("Arial", 10))
+            main_layout.addWidget(density_label)
+
+            density_hbox = QHBoxLayout()
+            self.density_combo = QComboBox()
+            self.density_combo.addItems(["72", "150", "300", "600"])
+            self.density_combo.setCurrentText("300")
+            density_desc_label = QLabel(
+                "Dots Per Inch - controls output quality (higher = better quality)"
+            )
+            density_desc_label.setStyleSheet("color: gray;")
+            density_hbox.addWidget(self.density_combo)
+            density_hbox.addWidget(density_desc_label)
+            main_layout.addLayout(density_hbox)
+
+            # Engine setting
+            engine_label = QLabel("Engine:")
+            engine_label.setFont(QFont("Arial", 10))
+            main_layout.addWidget(engine_label)
+
+            engine_hbox = QHBoxLayout()
+            self.engine_combo = QComboBox()
+            self.engine_combo.addItems(ENGINES)
+            self.engine_combo.setCurrentText(DEFAULT_ENGINE)
+            engine_desc_label = QLabel(
+                "pymupdf converts in process; imagemagick shells out to magick"
+            )
+            engine_desc_label.setStyleSheet("color: gray;")
+            engine_hbox.addWidget(self.engine_combo)
+            engine_hbox.addWidget(engine_desc_label)
+            main_layout.addLayout(engine_hbox)
+
+            # Worker process setting
+            workers_label = QLabel("Workers:")
+            workers_label.setFont(QFont("Arial", 10))
+            main_layout.addWidget(workers_label)
+
+            workers_hbox = QHBoxLayout()
+            self.workers_spinbox = QSpinBox()
+            self.workers_spinbox.setMinimum(1)
+            self.workers_spinbox.setMaximum(os.cpu_count() or 1)
+            self.workers_spinbox.setValue(1)
+            workers_desc_label = QLabel(
+                "Processes converting pages in parallel (pymupdf engine only)"
+            )
+            workers_desc_label.setStyleSheet("color: gray;")
+            workers_hbox.addWidget(self.workers_spinbox)
+            workers_hbox.addWidget(workers_desc_label)
+            main_layout.addLayout(workers_hbox)
+
+            # Target output size
+            target_label = QLabel("Target Size (MB):")
+            target_label.setFont(QFont("Arial", 10))
+            main_layout.addWidget(target_label)
+
+            target_hbox = QHBoxLayout()
+            self.target_size_spinbox = QDoubleSpinBox()
+            self.target_size_spinbox.setRange(0, 10000)
+            self.target_size_spinbox.setDecimals(1)
+            self.target_size_spinbox.setSpecialValueText("Off")
+            target_desc_label = QLabel(
+                "Pick DPI (up to Density) and JPEG quality to fit this size (pymupdf engine only)"
+            )
+            target_desc_label.setStyleSheet("color: gray;")
+            target_hbox.addWidget(self.target_size_spinbox)
+            target_hbox.addWidget(target_desc_label)
+            main_layout.addLayout(target_hbox)
+
+            # Page passthrough
+            self.passthrough_checkbox = QCheckBox(
+                "Keep pages that wouldn't shrink (text, low-resolution and compact scans) "
+                "as-is (pymupdf engine only)"
+            )
+            self.passthrough_checkbox.setChecked(True)
+            main_layout.addWidget(self.passthrough_checkbox)
+
+            # RAM-backed temp files
+            self.ram_temp_checkbox = QCheckBox(
+                f"Keep temporary files in {RAM_TEMP_ROOT} when they fit (imagemagick engine only)"
+            )
+            main_layout.addWidget(self.ram_temp_checkbox)
+
+            # Convert button
+            self.convert_button = QPushButton("Optimize PDF")
+            self.convert_button.clicked.connect(self.start_conversion)
+            main_layout.addWidget(self.convert_button)
+
+            # Cancel button
+            self.cancel_button = QPushButton("Cancel")
+            self.cancel_button.clicked.connect(self.cancel_conversion)
+            self.cancel_button.setEnabled(False)
+            main_layout.addWidget(self.cancel_button)
+
+            # Progress bar
+            self.progress_bar = QProgressBar()
+            self.progress_bar.setMaximum(100)
+            self.progress_bar.setValue(0)
+            self.progress_bar.setVisible(False)
+            main_layout.addWidget(self.progress_bar)
+
+            # Status label
+            self.status_label = QLabel("")
+            self.status_label.setAlignment(Qt.AlignCenter)
+            self.status_label.setStyleSheet("color: blue;")
+            main_layout.addWidget(self.status_label)
+
+            # Spacer to push everything to the top
+            main_layout.addStretch()
+
+            # Initialize worker thread
+            self.worker = None
+
+        def browse_file(self):
+            file_path, _ = QFileDialog.getOpenFileName(
+                self, "Select a PDF file", "", "PDF files (*.pdf);;All files (*)"
+            )
+            if file_path:
+                self.input_line_edit.setText(file_path)
+
+        def start_conversion(self):
+            input_file = self.input_line_edit.text()
+            if not input_file:
+                QMessageBox.critical(self, "Error", "Please select an input file.")
                 return
 
-            self.progress_update.emit(90)
-            self.status_update.emit("Finalizing...")
+            # Disable the convert button during processing
+            self.convert_button.setEnabled(False)
+            self.cancel_button.setEnabled(True)
+            self.progress_bar.setVisible(True)
+            self.status_label.setText("Starting conversion...")
+            self.status_label.setStyleSheet("color: blue;")
 
-            # Step 3: Remove all temp files
-            self.cleanup_temp_files(temp_dir)
+            # Start the conversion in a separate thread
+            self.worker = PDFConverterWorker(
+                input_file,
+                self.density_combo.currentText(),
+                self.engine_combo.currentText(),
+                self.workers_spinbox.value(),
+                self.ram_temp_checkbox.isChecked(),
+                int(self.target_size_spinbox.value() * 1024 * 1024) or None,
+                self.passthrough_checkbox.isChecked(),
+            )
+            self.worker.progress_update.connect(self.update_progress)
+            self.worker.status_update.connect(self.update_status)
+            self.worker.conversion_complete.connect(self.on_conversion_complete)
+            self.worker.start()
 
-            # Conversion successful
-            self.progress_update.emit(100)
-            self.status_update.emit(f"Successfully converted to {output_path.name}")
+        def cancel_conversion(self):
+            if self.worker is not None and self.worker.isRunning():
+                self.worker.requestInterruption()
+                self.cancel_button.setEnabled(False)
+                self.update_status("Cancelling...")
 
-            self.conversion_complete.emit(True, str(output_path))
+        def update_progress(self, value):
+            self.progress_bar.setValue(value)
 
-        except Exception as e:
-            self.status_update.emit(f"An error occurred: {str(e)}", True)
-            # Attempt to clean up temp files even if there's an exception
-            self.cleanup_temp_files(temp_dir)
-            self.conversion_complete.emit(False, "")
+        def update_status(self, text, is_error=False):
+            self.status_label.setText(text)
+            if is_error:
+                self.status_label.setStyleSheet("color: red;")
+            else:
+                self.status_label.setStyleSheet("color: blue;")
 
-    def cleanup_temp_files(self, temp_dir):
-        """Remove all temporary files"""
-        try:
-            import shutil
+        def on_conversion_complete(self, success, output_path):
+            if success and output_path:
+                self.update_progress(100)
+                reply = QMessageBox.question(
+                    self,
+                    "Success",
+                    f"Successfully converted!\n\nOutput: {output_path}\n\nOpen the PDF file?",
+                    QMessageBox.Yes | QMessageBox.No,
+                )
+                if reply == QMessageBox.Yes:
+                    if os.name == "nt":  # Windows
+                        os.system(f'start "" "{output_path}"')
+                    elif os.name == "posix":  # macOS/Linux
+                        os.system(f'open "{output_path}"')
 
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
-        except Exception as e:
-            print(f"Warning: Could not clean up temporary files: {str(e)}")
+            self.enable_controls()
 
+        def enable_controls(self):
+            self.convert_button.setEnabled(True)
+            self.cancel_button.setEnabled(False)
+            # Hide progress bar after 2 seconds
+            QTimer.singleShot(2000, lambda: self.progress_bar.setVisible(False))
 
-class PDFConverterGUI(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("PDF Converter")
-        self.setGeometry(100, 100, 600, 400)
-
-        # Central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-
-        # Main layout
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setContentsMargins(20, 20, 20, 20)
-
-        # Input file selection
-        input_label = QLabel("Input PDF File:")
-        input_label.setFont(QFont("Arial", 10))
-        main_layout.addWidget(input_label)
-
-        input_hbox = QHBoxLayout()
-        self.input_line_edit = QLineEdit()
-        self.browse_button = QPushButton("Browse")
-        self.browse_button.clicked.connect(self.browse_file)
-        input_hbox.addWidget(self.input_line_edit)
-        input_hbox.addWidget(self.browse_button)
-        main_layout.addLayout(input_hbox)
-
-        # Density setting
-        density_label = QLabel("Density (DPI):")
-        density_label.setFont(QFont("Arial", 10))
-        main_layout.addWidget(density_label)
-
-        density_hbox = QHBoxLayout()
-        self.density_combo = QComboBox()
-        self.density_combo.addItems(["72", "150", "300", "600"])
-        self.density_combo.setCurrentText("300")
-        density_desc_label = QLabel(
-            "Dots Per Inch - controls output quality (higher = better quality)"
+    return QApplication(sys.argv), PDFConverterGUI()
+
+
+class JobResult(NamedTuple):
+    """Outcome of one headless conversion."""
+
+    input_path: str
+    output_path: str
+    seconds: float
+    input_size: int
+    output_size: int
+    error: str | None = None
+
+
+def run_job(
+    input_path,
+    output_dir,
+    density,
+    engine,
+    workers,
+    use_ram,
+    target_size=None,
+    passthrough=False,
+):
+    """Convert one file for the CLI, capturing timing, sizes and errors."""
+    output_path = output_path_for(input_path, output_dir)
+    start = time.monotonic()
+    try:
+        convert_pdf_file(
+            input_path,
+            output_path,
+            density,
+            engine,
+            workers,
+            use_ram,
+            target_size=target_size,
+            passthrough=passthrough,
         )
-        density_desc_label.setStyleSheet("color: gray;")
-        density_hbox.addWidget(self.density_combo)
-        density_hbox.addWidget(density_desc_label)
-        main_layout.addLayout(density_hbox)
-
-        # Convert button
-        self.convert_button = QPushButton("Optimize PDF")
-        self.convert_button.clicked.connect(self.start_conversion)
-        main_layout.addWidget(self.convert_button)
-
-        # Progress bar
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setMaximum(100)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setVisible(False)
-        main_layout.addWidget(self.progress_bar)
-
-        # Status label
-        self.status_label = QLabel("")
-        self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("color: blue;")
-        main_layout.addWidget(self.status_label)
-
-        # Spacer to push everything to the top
-        main_layout.addStretch()
-
-        # Initialize worker thread
-        self.worker = None
-
-    def browse_file(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select a PDF file", "", "PDF files (*.pdf);;All files (*)"
+    except Exception as e:
+        return JobResult(
+            str(input_path), str(output_path), time.monotonic() - start, 0, 0, str(e)
         )
-        if file_path:
-            self.input_line_edit.setText(file_path)
+    return JobResult(
+        str(input_path),
+        str(output_path),
+        time.monotonic() - start,
+        os.path.getsize(input_path),
+        os.path.getsize(output_path),
+    )
 
-    def start_conversion(self):
-        input_file = self.input_line_edit.text()
-        if not input_file:
-            QMessageBox.critical(self, "Error", "Please select an input file.")
-            return
 
-        # Disable the convert button during processing
-        self.convert_button.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.status_label.setText("Starting conversion...")
-        self.status_label.setStyleSheet("color: blue;")
-
-        # Start the conversion in a separate thread
-        self.worker = PDFConverterWorker(input_file, self.density_combo.currentText())
-        self.worker.progress_update.connect(self.update_progress)
-        self.worker.status_update.connect(self.update_status)
-        self.worker.conversion_complete.connect(self.on_conversion_complete)
-        self.worker.start()
-
-    def update_progress(self, value):
-        self.progress_bar.setValue(value)
-
-    def update_status(self, text, is_error=False):
-        self.status_label.setText(text)
-        if is_error:
-            self.status_label.setStyleSheet("color: red;")
-        else:
-            self.status_label.setStyleSheet("color: blue;")
+def expand_inputs(inputs):
+    """Expand files and directories into the list of PDFs to convert.
 
-    def on_conversion_complete(self, success, output_path):
-        if success and output_path:
-            self.update_progress(100)
-            reply = QMessageBox.question(
-                self,
-                "Success",
-                f"Successfully converted!\n\nOutput: {output_path}\n\nOpen the PDF file?",
-                QMessageBox.Yes | QMessageBox.No,
+    Directories contribute the PDFs directly inside them, skipping earlier
+    ``_converted.pdf`` outputs.
+    """
+    pdf_paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            pdf_paths.extend(
+                sorted(
+                    os.path.join(item, name)
+                    for name in os.listdir(item)
+                    if name.lower().endswith(".pdf")
+                    and not name.endswith("_converted.pdf")
+                )
             )
-            if reply == QMessageBox.Yes:
-                if os.name == "nt":  # Windows
-                    os.system(f'start "" "{output_path}"')
-                elif os.name == "posix":  # macOS/Linux
-                    os.system(f'open "{output_path}"')
+        else:
+            pdf_paths.append(item)
+    return pdf_paths
+
+
+def run_cli(args):
+    """Convert every input headlessly, ``args.jobs`` files at a time.
 
-        self.enable_controls()
+    Returns:
+        Process exit code.
+    """
+    pdf_paths = expand_inputs(args.inputs)
+    if not pdf_paths:
+        print("Error: No input PDF files given.", file=sys.stderr)
+        return 1
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    start = time.monotonic()
+    failures = 0
+    total_in = total_out = 0
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        futures = [
+            executor.submit(
+                run_job,
+                pdf_path,
+                args.output_dir,
+                args.density,
+                args.engine,
+                args.workers,
+                args.ram_temp,
+                int(args.target_size * 1024 * 1024) if args.target_size else None,
+                not args.rasterize_all,
+            )
+            for pdf_path in pdf_paths
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            name = os.path.basename(result.input_path)
+            if result.error:
+                failures += 1
+                print(f"{name}: {result.error}", file=sys.stderr)
+                continue
+            total_in += result.input_size
+            total_out += result.output_size
+            ratio = result.input_size / result.output_size if result.output_size else 0
+            print(
+                f"{name}: {result.seconds:.1f}s, {result.input_size:,} -> "
+                f"{result.output_size:,} bytes ({ratio:.2f}x) -> {result.output_path}",
+                flush=True,
+            )
 
-    def enable_controls(self):
-        self.convert_button.setEnabled(True)
-        # Hide progress bar after 2 seconds
-        QTimer.singleShot(2000, lambda: self.progress_bar.setVisible(False))
+    ratio = total_in / total_out if total_out else 0
+    print(
+        f"Converted {len(pdf_paths) - failures} of {len(pdf_paths)} files in "
+        f"{time.monotonic() - start:.1f}s, {total_in:,} -> {total_out:,} bytes "
+        f"({ratio:.2f}x)"
+    )
+    return 1 if failures else 0
 
 
 def pdf_converter():
-    app = QApplication(sys.argv)
-    window = PDFConverterGUI()
+    """Run the GUI."""
+    app, window = setup_gui()
     window.show()
     sys.exit(app.exec_())
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Optimize PDFs by rasterizing and recompressing their pages."
+    )
+    parser.add_argument(
+        "--cli",
+        action="store_true",
+        help="Run in command-line mode instead of GUI mode.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="PDF files or directories of PDFs to convert (CLI mode).",
+    )
+    parser.add_argument(
+        "--density",
+        type=int,
+        default=300,
+        help="Dots per inch to render pages at (default: 300).",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default=DEFAULT_ENGINE,
+        help=f"Conversion engine (default: {DEFAULT_ENGINE}).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of files converted concurrently (default: 1).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes per file for the pymupdf engine (default: 1).",
+    )
+    parser.add_argument(
+        "--target-size",
+        type=float,
+        default=None,
+        metavar="MB",
+        help="Choose DPI (up to --density) and JPEG quality so each output fits in this many MB.",
+    )
+    parser.add_argument(
+        "--rasterize-all",
+        action="store_true",
+        help="Rasterize every page. By default the pymupdf engine copies pages that wouldn't shrink (text-only pages, low-resolution JPEGs, compact scans such as JBIG2 or CCITT) through as-is.",
+    )
+    parser.add_argument(
+        "--ram-temp",
+        action="store_true",
+        help=f"Keep ImageMagick temporary files in {RAM_TEMP_ROOT} when they fit.",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="Directory for converted files (default: next to each input).",
+    )
+
+    args = parser.parse_args()
+
+    if args.cli:
+        sys.exit(run_cli(args))
+    else:
+        pdf_converter()
+
+
 if __name__ == "__main__":
-    pdf_converter()
+    main()
@@ -8,42 +8,816 @@
 """Convert PDF pages to images with GUI or CLI interface."""
 
 import argparse
+import glob
+import hashlib
+import io
+import json
 import os
+import re
+import shutil
 import sys
+import tarfile
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
 from pathlib import Path
+from typing import BinaryIO, NamedTuple
 
 import pymupdf
 
 
-def create_images_from_pdf(pdf_path: str, output_dir: str, dpi: int = 300) -> list[str]:
+class PageImage(NamedTuple):
+    """A rendered page held in memory.
+
+    ``data`` is either the raw pixel samples (``height`` rows of
+    ``width * channels`` bytes) or the page encoded in ``image_format``.
+    When rendered in-process, raw ``data`` is a zero-copy view onto
+    ``pixmap``'s samples, which is kept here so the view stays valid.
+    """
+
+    page_number: int
+    width: int
+    height: int
+    channels: int
+    image_format: str | None
+    data: bytes | memoryview
+    pixmap: pymupdf.Pixmap | None = None
+
+    def __reduce__(self):
+        # Memoryviews and pixmaps cannot cross process boundaries
+        return (
+            PageImage,
+            (
+                self.page_number,
+                self.width,
+                self.height,
+                self.channels,
+                self.image_format,
+                bytes(self.data),
+            ),
+        )
+
+
+def page_image_to_array(image: PageImage):
+    """Return the raw samples of a page as a ``(height, width, channels)`` array.
+
+    Requires NumPy. The array shares memory with ``image.data``.
+    """
+    import numpy as np
+
+    if image.image_format is not None:
+        raise ValueError(
+            f"Page {image.page_number} is encoded as {image.image_format}, not raw samples."
+        )
+    return np.frombuffer(image.data, dtype=np.uint8).reshape(
+        image.height, image.width, image.channels
+    )
+
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_SAVE_INTERVAL = 1.0  # seconds between manifest writes while rendering
+DEFAULT_CACHE_SIZE = 1024 * 1024 * 1024  # bytes
+WORKER_DOCUMENT_LIMIT = 8  # documents each worker process keeps open
+TASKS_PER_WORKER = 4  # pages queued per worker process ahead of completion
+
+# Indirect references, and the keys whose values point at other pages (link
+# targets and page tree back-references) that are skipped when hashing a page
+_REFERENCE_PATTERN = re.compile(rb"(\d+)\s+\d+\s+R")
+_REFERENCE_VALUE_PATTERN = re.compile(rb"\d+\s+\d+\s+R")
+_SKIPPED_KEY_PATTERN = re.compile(rb"/(?:A|Dest|Parent|P)(?=[\s/\[<(])")
+_DELIMITERS = b"()<>[]{}/%"
+_WHITESPACE = b" \t\r\n\f\0"
+
+_worker_documents: dict[str, pymupdf.Document] = {}
+
+
+def _page_path(output_dir: str, page_number: int) -> str:
+    return os.path.join(output_dir, f"page-{page_number}.png")
+
+
+def _save_page(page: pymupdf.Page, output_dir: str, dpi: int) -> tuple[int, str]:
+    """Render a single page to ``page-{n}.png`` and return the written path."""
+    pix = page.get_pixmap(dpi=dpi)
+    output_path = _page_path(output_dir, page.number)
+    pix.save(output_path)
+    return page.number, output_path
+
+
+def page_cache_key(
+    page: pymupdf.Page, dpi: int, colorspace: str = "rgb", image_format: str = "png"
+) -> str:
+    """Return a content-addressed cache key for rendering a page.
+
+    The key hashes the page's content streams, geometry and every object
+    reachable from its resources and annotations, together with the render
+    settings. Object numbers are not part of the hash, so an unchanged page
+    gets the same key in a later revision of the document.
+    """
+    doc = page.parent
+    digest = hashlib.sha256()
+    digest.update(f"{dpi}:{colorspace}:{image_format}:".encode())
+    digest.update(f"{tuple(page.cropbox)}:{page.rotation}:".encode())
+    digest.update(page.read_contents())
+
+    # Walk the object graph breadth first; references are hashed by the
+    # order objects are first seen, and other pages are never entered
+    seen: dict[int, int] = {}
+    pending: deque[int] = deque()
+
+    def add(source: bytes) -> None:
+        source = _strip_skipped_keys(source)
+        digest.update(_REFERENCE_PATTERN.sub(b"R", source))
+        for match in _REFERENCE_PATTERN.finditer(source):
+            xref = int(match.group(1))
+            if xref not in seen:
+                seen[xref] = len(seen)
+                pending.append(xref)
+            digest.update(f"@{seen[xref]}".encode())
+
+    add(_inherited_key(doc, page.xref, "Resources").encode())
+    add(doc.xref_get_key(page.xref, "Annots")[1].encode())
+    while pending:
+        xref = pending.popleft()
+        if doc.xref_get_key(xref, "Type") == ("name", "/Page"):
+            digest.update(b"page")
+            continue
+        add(doc.xref_object(xref, compressed=True).encode())
+        if doc.xref_is_stream(xref):
+            digest.update(doc.xref_stream_raw(xref))
+    return digest.hexdigest()
+
+
+def _strip_skipped_keys(source: bytes) -> bytes:
+    """Remove the link and back-reference entries from PDF object text."""
+    parts = []
+    position = 0
+    while match := _SKIPPED_KEY_PATTERN.search(source, position):
+        parts.append(source[position : match.start()])
+        position = _skip_value(source, match.end())
+    parts.append(source[position:])
+    return b"".join(parts)
+
+
+def _skip_value(source: bytes, position: int) -> int:
+    """Return the position just past the PDF value starting at ``position``."""
+    end = len(source)
+    while position < end and source[position] in _WHITESPACE:
+        position += 1
+    if match := _REFERENCE_VALUE_PATTERN.match(source, position):
+        return match.end()
+    if source.startswith((b"<<", b"["), position):
+        depth = 0
+        while position < end:
+            if source.startswith((b"<<", b">>"), position):
+                depth += 1 if source[position] == ord("<") else -1
+                position += 2
+            elif source[position] in b"[]":
+                depth += 1 if source[position] == ord("[") else -1
+                position += 1
+            elif source[position] == ord("("):
+                position = _skip_string(source, position)
+            else:
+                position += 1
+            if depth == 0:
+                break
+        return position
+    if source.startswith(b"(", position):
+        return _skip_string(source, position)
+    if source.startswith(b"<", position):  # hex string
+        return source.find(b">", position) + 1 or end
+    # A name, number or keyword runs up to the next delimiter
+    position += 1
+    while (
+        position < end
+        and source[position] not in _WHITESPACE
+        and source[position] not in _DELIMITERS
+    ):
+        position += 1
+    return position
+
+
+def _skip_string(source: bytes, position: int) -> int:
+    """Return the position just past the literal string at ``position``."""
+    depth = 0
+    while position < len(source):
+        char = source[position : position + 1]
+        if char == b"\\":
+            position += 2
+            continue
+        if char == b"(":
+            depth += 1
+        elif char == b")":
+            depth -= 1
+            if depth == 0:
+                return position + 1
+        position += 1
+    return position
+
+
+def _inherited_key(doc: pymupdf.Document, xref: int, key: str) -> str:
+    """Return ``key`` of the page object ``xref``, as MuPDF resolves it.
+
+    Inheritable page attributes such as ``Resources`` may be set on any
+    ancestor in the page tree instead of the page itself, so walk up the
+    ``Parent`` chain until one has it.
+    """
+    seen = set()
+    while xref not in seen:
+        seen.add(xref)
+        kind, value = doc.xref_get_key(xref, key)
+        if kind != "null":
+            return value
+        kind, parent = doc.xref_get_key(xref, "Parent")
+        if kind != "xref":
+            break
+        xref = int(parent.split()[0])
+    return "null"
+
+
+class RenderCache:
+    """On-disk cache of rendered pages, evicted least recently used first.
+
+    Entries are PNG files named by ``page_cache_key``. Hits are linked (or
+    copied across filesystems) into the output directory instead of
+    re-rendering the page.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.png")
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        """Place a cached render at ``output_path``, returning whether it existed."""
+        cached_path = self.path_for(key)
+        if not os.path.exists(cached_path):
+            return False
+        # Touch the entry so eviction sees it as recently used
+        os.utime(cached_path)
+        _link_or_copy(cached_path, output_path)
+        return True
+
+    def store(self, key: str, pix: pymupdf.Pixmap, output_path: str) -> None:
+        """Save a freshly rendered page to the cache and to ``output_path``."""
+        cached_path = self.path_for(key)
+        os.makedirs(os.path.dirname(cached_path), exist_ok=True)
+        temp_path = f"{cached_path}.{os.getpid()}.tmp"
+        pix.save(temp_path, output="png")
+        os.replace(temp_path, cached_path)
+        _link_or_copy(cached_path, output_path)
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits ``max_bytes``.
+
+        Returns:
+            Number of entries removed.
+        """
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".png"):
+                    stat = os.stat(os.path.join(root, name))
+                    entries.append((stat.st_mtime, stat.st_size, os.path.join(root, name)))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+
+def _link_or_copy(source: str, destination: str) -> None:
+    if os.path.exists(destination):
+        os.remove(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def _save_page_cached(
+    page: pymupdf.Page, output_dir: str, dpi: int, cache: RenderCache
+) -> tuple[int, str, bool]:
+    """Like ``_save_page`` but served from ``cache`` when possible.
+
+    Returns:
+        Tuple of ``(page_number, image_path, cache_hit)``.
+    """
+    output_path = _page_path(output_dir, page.number)
+    key = page_cache_key(page, dpi)
+    if cache.fetch(key, output_path):
+        return page.number, output_path, True
+    cache.store(key, page.get_pixmap(dpi=dpi), output_path)
+    return page.number, output_path, False
+
+
+def _buffer_page(page: pymupdf.Page, dpi: int, image_format: str | None) -> PageImage:
+    """Render a single page into memory without touching disk."""
+    pix = page.get_pixmap(dpi=dpi)
+    if image_format is None:
+        return PageImage(
+            page.number, pix.width, pix.height, pix.n, None, pix.samples_mv, pix
+        )
+    return PageImage(
+        page.number,
+        pix.width,
+        pix.height,
+        pix.n,
+        image_format,
+        pix.tobytes(output=image_format),
+    )
+
+
+def _render_in_worker(render, pdf_path: str, page_number: int, *args):
+    """Apply ``render`` to one page inside a worker process.
+
+    The document is opened once per worker process and reused for every
+    page that worker is handed, keeping the most recently used
+    ``WORKER_DOCUMENT_LIMIT`` documents open.
+    """
+    doc = _worker_documents.pop(pdf_path, None)
+    if doc is None:
+        doc = pymupdf.open(pdf_path)
+        if len(_worker_documents) >= WORKER_DOCUMENT_LIMIT:
+            _worker_documents.pop(next(iter(_worker_documents))).close()
+    _worker_documents[pdf_path] = doc
+    return render(doc[page_number], *args)
+
+
+def _iter_pool_results(
+    executor: ProcessPoolExecutor, tasks: Iterable[tuple], max_pending: int
+) -> Iterator[tuple]:
+    """Run ``(tag, render, pdf_path, page_number, *args)`` tasks on a pool.
+
+    At most ``max_pending`` tasks are submitted ahead of completion so long
+    task lists don't queue up in memory.
+
+    Yields:
+        Tuples of ``(tag, future)`` for each finished task, in completion order.
+    """
+    pending = {}
+    for tag, *task in tasks:
+        pending[executor.submit(_render_in_worker, *task)] = tag
+        if len(pending) >= max_pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future
+    for future in as_completed(list(pending)):
+        yield pending.pop(future), future
+
+
+def _iter_rendered_pages(
+    pdf_path: str,
+    workers: int,
+    render,
+    *args,
+    page_numbers: Iterable[int] | None = None,
+) -> Iterator:
+    """Yield ``render(page, *args)`` for every page, in completion order.
+
+    Only the pages in ``page_numbers`` are rendered when it is given.
+    """
+    with pymupdf.open(pdf_path) as doc:
+        if page_numbers is None:
+            page_numbers = range(doc.page_count)
+        page_numbers = list(page_numbers)
+        if workers <= 1 or len(page_numbers) <= 1:
+            for page_number in page_numbers:
+                yield render(doc[page_number], *args)
+            return
+
+    workers = min(workers, len(page_numbers))
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        tasks = (
+            (None, render, pdf_path, page_number, *args)
+            for page_number in page_numbers
+        )
+        for _, future in _iter_pool_results(
+            executor, tasks, workers * TASKS_PER_WORKER
+        ):
+            yield future.result()
+    finally:
+        # Stop queued pages if the caller abandons the generator early
+        executor.shutdown(cancel_futures=True)
+
+
+def file_sha256(path: str) -> str:
+    """Return the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(output_dir: str) -> dict | None:
+    """Load the resume manifest from an output directory, if there is one."""
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as f:
+        return json.load(f)
+
+
+def save_manifest(output_dir: str, manifest: dict) -> None:
+    """Atomically write the resume manifest to an output directory."""
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    temp_path = f"{manifest_path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, manifest_path)
+
+
+def stale_pages(manifest: dict, output_dir: str) -> list[int]:
+    """Return the pages in a manifest whose output is missing or out of date.
+
+    A page is stale unless it is marked done and its image file still
+    matches the recorded checksum.
+    """
+    pages = []
+    for page_number in range(manifest["page_count"]):
+        entry = manifest["pages"].get(str(page_number), {})
+        output_path = _page_path(output_dir, page_number)
+        if (
+            entry.get("status") != "done"
+            or not os.path.exists(output_path)
+            or file_sha256(output_path) != entry.get("sha256")
+        ):
+            pages.append(page_number)
+    return pages
+
+
+def prepare_manifest(pdf_path: str, output_dir: str, dpi: int) -> dict:
+    """Load the manifest for a resumable run, starting over if it no longer applies.
+
+    The previous manifest is discarded when the source PDF's hash or the DPI
+    differs from the one it was written for.
+    """
+    source_sha256 = file_sha256(pdf_path)
+    manifest = load_manifest(output_dir)
+    if (
+        manifest is None
+        or manifest.get("source_sha256") != source_sha256
+        or manifest.get("dpi") != dpi
+    ):
+        with pymupdf.open(pdf_path) as doc:
+            page_count = doc.page_count
+        manifest = {
+            "source": os.path.basename(pdf_path),
+            "source_sha256": source_sha256,
+            "dpi": dpi,
+            "page_count": page_count,
+            "pages": {},
+        }
+    return manifest
+
+
+def _iter_saved_pages(
+    pdf_path: str,
+    output_dir: str,
+    dpi: int,
+    workers: int,
+    cache: RenderCache | None,
+    page_numbers: Iterable[int] | None = None,
+) -> Iterator[tuple[int, str]]:
+    """Write pages to ``output_dir``, going through ``cache`` when one is given."""
+    if cache is None:
+        yield from _iter_rendered_pages(
+            pdf_path, workers, _save_page, output_dir, dpi, page_numbers=page_numbers
+        )
+        return
+
+    try:
+        for page_number, image_path, hit in _iter_rendered_pages(
+            pdf_path,
+            workers,
+            _save_page_cached,
+            output_dir,
+            dpi,
+            cache,
+            page_numbers=page_numbers,
+        ):
+            # Counted here since workers only update their own copy of the cache
+            if hit:
+                cache.hits += 1
+            else:
+                cache.misses += 1
+            yield page_number, image_path
+    finally:
+        cache.evict()
+
+
+def iter_images_from_pdf(
+    pdf_path: str,
+    output_dir: str,
+    dpi: int = 300,
+    workers: int = 1,
+    resume: bool = False,
+    cache: RenderCache | None = None,
+) -> Iterator[tuple[int, str]]:
+    """Convert each page of a PDF to an image, yielding pages as they finish.
+
+    With more than one worker, pages are yielded in completion order rather
+    than page order.
+
+    Args:
+        pdf_path: Path to the input PDF file.
+        output_dir: Directory to save the output images.
+        dpi: Resolution for the generated images (default: 300).
+        workers: Number of processes used to render pages (default: 1).
+        resume: Track progress in a manifest in ``output_dir`` and only
+            render pages that are missing or stale (default: False).
+        cache: Reuse renders of identical pages from this cache (default: None).
+
+    Yields:
+        Tuples of ``(page_number, image_path)`` for each written page.
+    """
+    if not resume:
+        yield from _iter_saved_pages(pdf_path, output_dir, dpi, workers, cache)
+        return
+
+    manifest = prepare_manifest(pdf_path, output_dir, dpi)
+    pending = stale_pages(manifest, output_dir)
+    for page_number in pending:
+        manifest["pages"][str(page_number)] = {"status": "pending"}
+    save_manifest(output_dir, manifest)
+
+    last_saved = time.monotonic()
+    try:
+        for page_number, image_path in _iter_saved_pages(
+            pdf_path, output_dir, dpi, workers, cache, pending
+        ):
+            manifest["pages"][str(page_number)] = {
+                "status": "done",
+                "sha256": file_sha256(image_path),
+            }
+            if time.monotonic() - last_saved >= MANIFEST_SAVE_INTERVAL:
+                save_manifest(output_dir, manifest)
+                last_saved = time.monotonic()
+            yield page_number, image_path
+    finally:
+        save_manifest(output_dir, manifest)
+
+
+def iter_page_buffers(
+    pdf_path: str,
+    dpi: int = 300,
+    workers: int = 1,
+    image_format: str | None = None,
+) -> Iterator[PageImage]:
+    """Render each page of a PDF into memory, yielding pages as they finish.
+
+    With a single worker and no ``image_format``, each page's ``data`` is a
+    zero-copy ``memoryview`` of the pixmap samples. Pages rendered by worker
+    processes arrive as ``bytes``.
+
+    Args:
+        pdf_path: Path to the input PDF file.
+        dpi: Resolution for the rendered pages (default: 300).
+        workers: Number of processes used to render pages (default: 1).
+        image_format: Encode pages with this pymupdf output format (e.g.
+            ``"png"``, ``"jpeg"``, ``"ppm"``) instead of returning raw samples.
+
+    Yields:
+        A ``PageImage`` for each rendered page.
+    """
+    yield from _iter_rendered_pages(pdf_path, workers, _buffer_page, dpi, image_format)
+
+
+def create_images_from_pdf(
+    pdf_path: str,
+    output_dir: str,
+    dpi: int = 300,
+    workers: int = 1,
+    resume: bool = False,
+    cache: RenderCache | None = None,
+) -> list[str]:
     """Convert each page of a PDF to an image.
 
     Args:
         pdf_path: Path to the input PDF file.
         output_dir: Directory to save the output images.
         dpi: Resolution for the generated images (default: 300).
+        workers: Number of processes used to render pages (default: 1).
+        resume: Only render pages that are missing or stale according to
+            the manifest in ``output_dir`` (default: False).
+        cache: Reuse renders of identical pages from this cache (default: None).
 
     Returns:
-        List of paths to the generated image files.
+        List of paths to the generated image files, in page order. When
+        resuming this includes pages kept from a previous run.
     """
-    doc = pymupdf.open(pdf_path)
-    image_paths = []
+    pages = sorted(
+        iter_images_from_pdf(pdf_path, output_dir, dpi, workers, resume, cache)
+    )
+    if resume:
+        page_count = load_manifest(output_dir)["page_count"]
+        return [_page_path(output_dir, n) for n in range(page_count)]
+    return [image_path for _, image_path in pages]
+
+
+class DocumentSummary(NamedTuple):
+    """Outcome of converting one document in a batch."""
 
-    for page in doc:
-        pix = page.get_pixmap(dpi=dpi)
-        output_path = os.path.join(output_dir, f"page-{page.number}.png")
-        pix.save(output_path)
-        image_paths.append(output_path)
+    pdf_path: str
+    target_dir: str
+    page_count: int
+    seconds: float
+    error: str | None = None
 
-    doc.close()
-    return image_paths
 
+def expand_batch_inputs(inputs: Iterable[str]) -> list[str]:
+    """Expand batch inputs into a list of PDF paths.
+
+    Each input may be a PDF file, a directory (all PDFs directly inside it),
+    a glob pattern, or ``@file`` naming a text file with one path per line.
+    """
+    pdf_paths = []
+    for item in inputs:
+        if item.startswith("@"):
+            with open(item[1:]) as f:
+                pdf_paths.extend(
+                    expand_batch_inputs(line.strip() for line in f if line.strip())
+                )
+        elif os.path.isdir(item):
+            pdf_paths.extend(
+                sorted(
+                    os.path.join(item, name)
+                    for name in os.listdir(item)
+                    if name.lower().endswith(".pdf")
+                )
+            )
+        elif glob.has_magic(item):
+            pdf_paths.extend(sorted(glob.glob(item)))
+        else:
+            pdf_paths.append(item)
+    # Inputs may overlap, e.g. a directory and a glob inside it
+    return list(dict.fromkeys(os.path.abspath(path) for path in pdf_paths))
+
+
+def convert_batch(
+    pdf_paths: Iterable[str],
+    output_dir: str,
+    dpi: int = 300,
+    workers: int = 1,
+    cache: RenderCache | None = None,
+) -> Iterator[DocumentSummary]:
+    """Convert many PDFs, scheduling all of their pages on one shared pool.
+
+    Each document is written to ``output_dir/<pdf name>``. Pages from every
+    document are fed through the same worker processes, so small documents
+    keep cores busy while a large one is still rendering.
+
+    Args:
+        pdf_paths: Paths to the input PDF files.
+        output_dir: Directory under which each document's images are saved.
+        dpi: Resolution for the generated images (default: 300).
+        workers: Number of processes used to render pages (default: 1).
+        cache: Reuse renders of identical pages from this cache (default: None).
+
+    Yields:
+        A ``DocumentSummary`` for each document as it finishes or fails.
+    """
+    if cache is None:
+        render, render_args = _save_page, (dpi,)
+    else:
+        render, render_args = _save_page_cached, (dpi, cache)
+
+    # Check every document up front so bad inputs are reported immediately
+    documents = []
+    seen_targets = set()
+    for pdf_path in pdf_paths:
+        target_dir = os.path.join(output_dir, Path(pdf_path).stem)
+        try:
+            if target_dir in seen_targets:
+                raise ValueError(
+                    f"Another PDF in the batch also writes to {target_dir}"
+                )
+            seen_targets.add(target_dir)
+            validate_output_directory(target_dir)
+            with pymupdf.open(pdf_path) as doc:
+                page_count = doc.page_count
+            os.makedirs(target_dir, exist_ok=True)
+        except Exception as e:
+            yield DocumentSummary(pdf_path, target_dir, 0, 0.0, str(e))
+            continue
+        documents.append((pdf_path, target_dir, page_count))
+
+    # Empty documents have nothing to schedule
+    for pdf_path, target_dir, page_count in documents:
+        if page_count == 0:
+            yield DocumentSummary(pdf_path, target_dir, 0, 0.0)
+    documents = [document for document in documents if document[2] > 0]
+
+    started: dict[str, float] = {}
+    remaining = {pdf_path: page_count for pdf_path, _, page_count in documents}
+
+    def record(tag: tuple[str, str, int], result: tuple) -> DocumentSummary | None:
+        """Count a finished page, returning a summary once its document is done."""
+        pdf_path, target_dir, page_count = tag
+        if cache is not None:
+            if result[2]:
+                cache.hits += 1
+            else:
+                cache.misses += 1
+        remaining[pdf_path] -= 1
+        if remaining[pdf_path] > 0:
+            return None
+        del remaining[pdf_path]
+        seconds = time.monotonic() - started[pdf_path]
+        return DocumentSummary(pdf_path, target_dir, page_count, seconds)
+
+    def failed(tag: tuple[str, str, int], error: Exception) -> DocumentSummary:
+        pdf_path, target_dir, page_count = tag
+        del remaining[pdf_path]
+        seconds = time.monotonic() - started[pdf_path]
+        return DocumentSummary(pdf_path, target_dir, page_count, seconds, str(error))
+
+    try:
+        if workers <= 1:
+            for tag in documents:
+                pdf_path, target_dir, _ = tag
+                started[pdf_path] = time.monotonic()
+                try:
+                    with pymupdf.open(pdf_path) as doc:
+                        for page in doc:
+                            summary = record(tag, render(page, target_dir, *render_args))
+                except Exception as e:
+                    summary = failed(tag, e)
+                yield summary
+            return
+
+        def tasks() -> Iterator[tuple]:
+            for tag in documents:
+                pdf_path, target_dir, page_count = tag
+                started[pdf_path] = time.monotonic()
+                for page_number in range(page_count):
+                    # Stop scheduling pages of a document that already failed
+                    if pdf_path not in remaining:
+                        break
+                    yield tag, render, pdf_path, page_number, target_dir, *render_args
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            for tag, future in _iter_pool_results(
+                executor, tasks(), workers * TASKS_PER_WORKER
+            ):
+                if tag[0] not in remaining:
+                    continue
+                try:
+                    summary = record(tag, future.result())
+                except Exception as e:
+                    summary = failed(tag, e)
+                if summary is not None:
+                    yield summary
+        finally:
+            executor.shutdown(cancel_futures=True)
+    finally:
+        if cache is not None:
+            cache.evict()
 
-def validate_output_directory(output_dir: str) -> None:
+
+def write_tar_stream(
+    pdf_path: str, stream: BinaryIO, dpi: int = 300, workers: int = 1
+) -> int:
+    """Write every page of a PDF as ``page-{n}.png`` members of a tar stream.
+
+    Args:
+        pdf_path: Path to the input PDF file.
+        stream: Writable binary stream, e.g. ``sys.stdout.buffer``.
+        dpi: Resolution for the generated images (default: 300).
+        workers: Number of processes used to render pages (default: 1).
+
+    Returns:
+        Number of pages written.
+    """
+    page_count = 0
+    with tarfile.open(fileobj=stream, mode="w|") as tar:
+        for image in iter_page_buffers(pdf_path, dpi, workers, image_format="png"):
+            info = tarfile.TarInfo(f"page-{image.page_number}.png")
+            info.size = len(image.data)
+            tar.addfile(info, io.BytesIO(image.data))
+            page_count += 1
+    return page_count
+
+
+def validate_output_directory(output_dir: str, resume: bool = False) -> None:
     """Validate that the output directory exists and is empty or doesn't exist.
 
     Args:
         output_dir: Path to the output directory.
+        resume: Allow a directory holding a previous run's manifest.
 
     Raises:
         ValueError: If the directory exists and contains PNG files.
@@ -52,6 +826,9 @@ def validate_output_directory(output_dir: str) -> None:
         if not os.path.isdir(output_dir):
             raise ValueError(f"Output path exists but is not a directory: {output_dir}")
 
+        if resume and os.path.exists(os.path.join(output_dir, MANIFEST_NAME)):
+            return
+
         # Check if directory contains any PNG files
         png_files = [f for f in os.listdir(output_dir) if f.lower().endswith(".png")]
         if png_files:
@@ -73,6 +850,7 @@ def setup_gui():
         QPushButton,
         QFileDialog,
         QSpinBox,
+        QCheckBox,
         QMessageBox,
     )
     from PyQt5.QtCore import Qt
@@ -121,6 +899,23 @@ def setup_gui():
             dpi_layout.addStretch()
             layout.addLayout(dpi_layout)
 
+            # Worker process count
+            workers_layout = QHBoxLayout()
+            workers_layout.addWidget(QLabel("Workers:"))
+            self.workers_spinbox = QSpinBox()
+            self.workers_spinbox.setMinimum(1)
+            self.workers_spinbox.setMaximum(os.cpu_count() or 1)
+            self.workers_spinbox.setValue(1)
+            workers_layout.addWidget(self.workers_spinbox)
+            workers_layout.addStretch()
+            layout.addLayout(workers_layout)
+
+            # Resume setting
+            self.resume_checkbox = QCheckBox(
+                "Resume: only render pages missing from a previous run"
+            )
+            layout.addWidget(self.resume_checkbox)
+
             # Convert button
             self.convert_button = QPushButton("Convert")
             self.convert_button.clicked.connect(self.convert_pdf)
@@ -161,6 +956,8 @@ def setup_gui():
             pdf_path = self.pdf_input.text().strip()
             output_dir = self.output_input.text().strip()
             dpi = self.dpi_spinbox.value()
+            workers = self.workers_spinbox.value()
+            resume = self.resume_checkbox.isChecked()
 
             # Validate inputs
             if not pdf_path:
@@ -181,13 +978,15 @@ def setup_gui():
 
             try:
                 # Validate output directory
-                validate_output_directory(target_dir)
+                validate_output_directory(target_dir, resume)
 
                 # Create output directory if it doesn't exist
                 os.makedirs(target_dir, exist_ok=True)
 
                 # Convert PDF to images
-                image_paths = create_images_from_pdf(pdf_path, target_dir, dpi)
+                image_paths = create_images_from_pdf(
+                    pdf_path, target_dir, dpi, workers, resume
+                )
 
                 QMessageBox.information(
                     self,
@@ -203,6 +1002,47 @@ def setup_gui():
     return QApplication(sys.argv), PDFConverterGUI()
 
 
+def run_batch(args: argparse.Namespace) -> None:
+    """Run the ``--batch`` CLI mode, printing a summary line per document."""
+    pdf_paths = expand_batch_inputs(args.batch)
+    if not pdf_paths:
+        print("Error: No PDF files matched --batch.", file=sys.stderr)
+        sys.exit(1)
+
+    output_dir = os.path.abspath(args.output or ".")
+    cache = None
+    if args.cache_dir:
+        cache = RenderCache(args.cache_dir, args.cache_size * 1024 * 1024)
+
+    start = time.monotonic()
+    total_pages = 0
+    failures = 0
+    for summary in convert_batch(pdf_paths, output_dir, args.dpi, args.workers, cache):
+        name = os.path.basename(summary.pdf_path)
+        if summary.error:
+            failures += 1
+            print(f"{name}: Error: {summary.error}", file=sys.stderr)
+            continue
+        total_pages += summary.page_count
+        rate = summary.page_count / summary.seconds if summary.seconds else 0.0
+        print(
+            f"{name}: {summary.page_count} pages in {summary.seconds:.1f}s "
+            f"({rate:.1f} pages/s) -> {summary.target_dir}",
+            flush=True,
+        )
+
+    elapsed = time.monotonic() - start
+    rate = total_pages / elapsed if elapsed else 0.0
+    print(
+        f"Converted {total_pages} pages from {len(pdf_paths) - failures} of "
+        f"{len(pdf_paths)} PDFs in {elapsed:.1f}s ({rate:.1f} pages/s)."
+    )
+    if cache is not None:
+        print(f"Render cache: {cache.hits} hits, {cache.misses} misses")
+    if failures:
+        sys.exit(1)
+
+
 def main():
     """Main entry point for the PDF to images converter."""
     parser = argparse.ArgumentParser(
@@ -216,6 +1056,12 @@ def main():
     parser.add_argument(
         "--pdf", type=str, help="Path to the input PDF file (required in CLI mode)."
     )
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="INPUT",
+        help="Convert many PDFs on one shared worker pool. Each INPUT is a PDF, a directory, a glob pattern or @file listing one path per line.",
+    )
     parser.add_argument(
         "--output",
         type=str,
@@ -228,11 +1074,43 @@ def main():
         default=300,
         help="Resolution for the generated images (default: 300).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to render pages (default: 1).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Keep a {MANIFEST_NAME} in the output directory and only render pages that are missing or stale.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Reuse renders of unchanged pages from this cache directory.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+        help=f"Maximum render cache size in MB (default: {DEFAULT_CACHE_SIZE // (1024 * 1024)}).",
+    )
+    parser.add_argument(
+        "--stdout",
+        action="store_true",
+        help="Write the pages as a tar stream of PNG files to stdout instead of a directory.",
+    )
 
     args = parser.parse_args()
 
     if args.cli:
         # CLI mode
+        if args.batch:
+            run_batch(args)
+            return
+
         if not args.pdf:
             print("Error: --pdf is required in CLI mode.", file=sys.stderr)
             sys.exit(1)
@@ -240,6 +1118,17 @@ def main():
         pdf_path = os.path.abspath(args.pdf)
         pdf_name = Path(pdf_path).stem
 
+        if args.stdout:
+            try:
+                page_count = write_tar_stream(
+                    pdf_path, sys.stdout.buffer, args.dpi, args.workers
+                )
+                print(f"Successfully streamed {page_count} pages.", file=sys.stderr)
+            except Exception as e:
+                print(f"Error: An error occurred: {str(e)}", file=sys.stderr)
+                sys.exit(1)
+            return
+
         # Default output directory is PDF name without extension
         if args.output is None:
             output_dir = pdf_name
@@ -249,16 +1138,27 @@ def main():
 
         try:
             # Validate output directory
-            validate_output_directory(target_dir)
+            validate_output_directory(target_dir, args.resume)
 
             # Create output directory if it doesn't exist
             os.makedirs(target_dir, exist_ok=True)
 
-            # Convert PDF to images
-            image_paths = create_images_from_pdf(pdf_path, target_dir, args.dpi)
+            cache = None
+            if args.cache_dir:
+                cache = RenderCache(args.cache_dir, args.cache_size * 1024 * 1024)
+
+            # Convert PDF to images, printing each file as soon as it exists
+            image_paths = []
+            for _, image_path in iter_images_from_pdf(
+                pdf_path, target_dir, args.dpi, args.workers, args.resume, cache
+            ):
+                print(image_path, flush=True)
+                image_paths.append(image_path)
 
             print(f"Successfully converted {len(image_paths)} pages to images.")
             print(f"Images saved in: {target_dir}")
+            if cache is not None:
+                print(f"Render cache: {cache.hits} hits, {cache.misses} misses")
         except ValueError as e:
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
@@ -9,140 +9,983 @@
 """
 QR Code Generator Application
 A PyQt5 application that takes a string input and generates a QR code.
+
+Also generates QR codes in bulk from CSV or JSON-lines files, from the GUI
+or headless with --cli.
 """
 
+import argparse
+import csv
+import functools
+import json
+import os
+import re
+import struct
 import sys
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
 import segno
-from PyQt5.QtWidgets import (
-    QApplication,
-    QWidget,
-    QLabel,
-    QTextEdit,
-    QPushButton,
-    QVBoxLayout,
-    QHBoxLayout,
-    QFileDialog,
-    QMessageBox,
-)
-from PyQt5.QtGui import QPixmap, QImage
-from PyQt5.QtCore import Qt
-
-
-class QRGeneratorApp(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.qr_image = None
-        self.init_ui()
-
-    def init_ui(self):
-        self.setWindowTitle("QR Code Generator")
-        self.setGeometry(300, 300, 500, 600)
-
-        # Create layout
-        layout = QVBoxLayout()
-
-        # Input label
-        input_label = QLabel("Enter text to encode:")
-        layout.addWidget(input_label)
-
-        # Text input area
-        self.text_input = QTextEdit()
-        self.text_input.setFixedHeight(100)
-        layout.addWidget(self.text_input)
-
-        # Generate button
-        self.generate_button = QPushButton("Generate QR Code")
-        self.generate_button.clicked.connect(self.generate_qr)
-        layout.addWidget(self.generate_button)
-
-        # QR code display label
-        self.qr_label = QLabel()
-        self.qr_label.setAlignment(Qt.AlignCenter)
-        self.qr_label.setMinimumSize(300, 300)
-        self.qr_label.setStyleSheet("border: 1px solid gray;")
-        layout.addWidget(self.qr_label)
-
-        # Save button
-        self.save_button = QPushButton("Save QR Code")
-        self.save_button.clicked.connect(self.save_qr)
-        self.save_button.setEnabled(False)  # Initially disabled
-        layout.addWidget(self.save_button)
-
-        # Status label
-        self.status_label = QLabel("")
-        layout.addWidget(self.status_label)
-
-        self.setLayout(layout)
-
-    def generate_qr(self):
-        text = self.text_input.toPlainText().strip()
-
-        if not text:
-            QMessageBox.warning(self, "Warning", "Please enter some text to encode.")
+
+SHEET = "sheet"  # all codes in one multi-page PDF
+FILE_FORMATS = ["png", "svg", "eps", "pdf"]  # one file per code
+BULK_FORMATS = FILE_FORMATS + [SHEET]
+BULK_BATCH_SIZE = 64  # records encoded per worker task
+BULK_SCALE = 10  # pixels per module for PNG/SVG files
+BULK_BORDER = 4  # quiet zone in modules
+TASKS_PER_WORKER = 4  # batches queued per worker process ahead of completion
+REPORT_INTERVAL = 1.0  # seconds between progress reports
+PREVIEW_SIZE = 300  # pixels
+SAVE_SCALE = 10  # pixels per module when saving from the GUI
+PREVIEW_DEBOUNCE = 250  # milliseconds of typing pause before a live preview
+ENCODE_CACHE_SIZE = 64  # recent encodings kept for undo/redo and retyping
+
+ERROR_LEVELS = ["l", "m", "q", "h"]
+DEFAULT_MIN_ERROR = "h"
+MAX_SEQUENCE_SYMBOLS = 16  # structured append limit
+
+# Save dialog filters, mapped to (kind, scale) for save_codes
+SAVE_FILTERS = {
+    "PNG Files (*.png)": ("png", SAVE_SCALE),
+    "Compact PNG, 1 pixel per module (*.png)": ("png", 1),
+    "SVG Files (*.svg)": ("svg", SAVE_SCALE),
+    "EPS Files (*.eps)": ("eps", SAVE_SCALE),
+    "PDF Files (*.pdf)": ("pdf", SAVE_SCALE),
+    "PDF Sheet, all symbols in one file (*.pdf)": (SHEET, None),
+}
+
+# PDF sheet layout, in points
+SHEET_PAGE_SIZE = (595, 842)  # A4
+SHEET_CELL_SIZE = 108  # 1.5 inch per code
+SHEET_MARGIN = 36
+SHEET_GAP = 18
+
+
+class QRPlan(NamedTuple):
+    """The symbols chosen by ``optimize_qr`` and what they cost."""
+
+    codes: list  # one segno code, or a structured append sequence
+    version: int
+    error: str
+    mode: str
+    modules: int  # modules per side, without the quiet zone
+
+    def describe(self):
+        symbol = f"version {self.version} ({self.modules}x{self.modules} modules)"
+        if len(self.codes) > 1:
+            symbol = f"{len(self.codes)} symbols (structured append), each {symbol}"
+        else:
+            symbol = symbol.capitalize()
+        return f"{symbol}, error level {self.error}, {self.mode} mode"
+
+
+def _plan(codes):
+    first = codes[0]
+    return QRPlan(
+        list(codes),
+        first.version,
+        first.error,
+        first.mode,
+        first.symbol_size(scale=1, border=0)[0],
+    )
+
+
+@functools.lru_cache(maxsize=ENCODE_CACHE_SIZE)
+def optimize_qr(text, min_error=DEFAULT_MIN_ERROR, max_version=None):
+    """Choose the smallest QR symbol for ``text``.
+
+    segno already encodes in the densest mode that applies to the text, so
+    one encode at ``min_error`` finds the smallest version; the error level
+    is then boosted as far as that version allows. If the symbol is above
+    ``max_version``, the text is split into a structured append sequence of
+    symbols no larger than ``max_version`` instead.
+
+    Large payloads at error level "h" take a noticeable time to encode, so
+    recent results are cached; the returned codes must not be modified.
+
+    Raises:
+        ValueError: If the text does not fit, even when split.
+    """
+    try:
+        code = segno.make(text, error=min_error, micro=False, boost_error=True)
+    except ValueError:
+        code = None  # data too large for a single symbol
+
+    if code is not None and (max_version is None or code.version <= max_version):
+        return _plan([code])
+    if max_version is None:
+        raise ValueError(
+            "Data too large for a single QR code; set a maximum version to split it"
+        )
+
+    sequence = segno.make_sequence(
+        text, version=max_version, error=min_error, boost_error=True
+    )
+    if len(sequence) > MAX_SEQUENCE_SYMBOLS:
+        raise ValueError(
+            f"Data needs more than {MAX_SEQUENCE_SYMBOLS} symbols at version {max_version}"
+        )
+    return _plan(sequence)
+
+
+def iter_records(path, column=None):
+    """Yield ``(name, text)`` records from a CSV or JSON-lines file.
+
+    The file is read lazily, so inputs of any size can be processed. CSV
+    files need a header row; the text comes from ``column`` (default: the
+    first column). JSON-lines records are objects with a ``column`` key
+    (default: ``"text"``) or bare strings. An optional ``name`` field or
+    column is used for the output file name.
+
+    Raises:
+        ValueError: If ``column`` is not present in the CSV header, or a
+            JSON-lines record is not valid JSON, an object or a string.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            reader = csv.DictReader(f)
+            if not reader.fieldnames:
+                return
+            field = column or reader.fieldnames[0]
+            if field not in reader.fieldnames:
+                raise ValueError(f"Column {field!r} not found in {path}")
+            for row in reader:
+                if row.get(field):
+                    yield row.get("name") or None, row[field]
+        else:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}, line {line_number}: {e.msg}") from e
+                if isinstance(record, str):
+                    yield None, record
+                elif not isinstance(record, dict):
+                    raise ValueError(
+                        f"{path}, line {line_number}: expected an object or "
+                        f"a string, got {type(record).__name__}"
+                    )
+                elif record.get(column or "text"):
+                    yield record.get("name") or None, str(record[column or "text"])
+
+
+def output_name(index, name=None):
+    """Return a safe file name stem for record ``index``."""
+    if name:
+        name = re.sub(r"[^\w.-]+", "_", str(name)).strip("._")
+    return name or f"{index:06d}"
+
+
+def mono_bitmap(qr_code, size, border=BULK_BORDER, align=4):
+    """Render ``qr_code`` as a packed 1-bit bitmap, dark modules set.
+
+    Modules are scaled by the largest whole factor that fits ``size`` and the
+    symbol is centred, so edges stay sharp without resampling. Scanlines are
+    padded to ``align`` bytes: 4 matches ``QImage.Format_Mono``.
+
+    Returns:
+        ``(size, bytes_per_line, data)``; ``size`` grows to the symbol size
+        if the requested one is too small.
+    """
+    modules = qr_code.symbol_size(scale=1, border=border)[0]
+    size = max(size, modules)
+    scale = size // modules
+    offset = (size - modules * scale) // 2
+    bytes_per_line = -(-size // (8 * align)) * align
+    line_bits = bytes_per_line * 8
+
+    blank = bytes(bytes_per_line)
+    dark, light = "1" * scale, "0" * scale
+    lead = "0" * offset
+    rows = [blank] * offset
+    for row in qr_code.matrix_iter(scale=1, border=border):
+        bits = lead + "".join([dark if module else light for module in row])
+        packed = int(bits.ljust(line_bits, "0"), 2).to_bytes(bytes_per_line, "big")
+        rows.extend([packed] * scale)
+    rows.extend([blank] * (size - len(rows)))
+    return size, bytes_per_line, b"".join(rows)
+
+
+_INVERT = bytes(255 - i for i in range(256))
+
+
+def _png_chunk(tag, data):
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+
+def write_mono_png(stream, qr_code, scale=BULK_SCALE, border=BULK_BORDER):
+    """Write ``qr_code`` to ``stream`` as a 1-bit grayscale PNG."""
+    size, bytes_per_line, data = mono_bitmap(
+        qr_code, qr_code.symbol_size(scale=scale, border=border)[0], border, align=1
+    )
+    # PNG grayscale has 0 as black, so invert and prefix each row's filter byte
+    raw = b"".join(
+        b"\0" + data[i : i + bytes_per_line].translate(_INVERT)
+        for i in range(0, len(data), bytes_per_line)
+    )
+    stream.write(
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 1, 0, 0, 0, 0))
+        + _png_chunk(b"IDAT", zlib.compress(raw))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+def pdf_fragment(qr_code, border=BULK_BORDER):
+    """Return ``(size, ops)`` drawing ``qr_code`` as PDF rectangles.
+
+    ``ops`` fills each run of dark modules with one rectangle in a
+    ``size`` x ``size`` module coordinate system, origin at the bottom left.
+    """
+    rows = list(qr_code.matrix_iter(scale=1, border=border))
+    size = len(rows)
+    ops = []
+    for y, row in enumerate(rows):
+        x = 0
+        while x < size:
+            if row[x]:
+                start = x
+                while x < size and row[x]:
+                    x += 1
+                ops.append(f"{start} {size - y - 1} {x - start} 1 re")
+            else:
+                x += 1
+    return size, "\n".join(ops).encode()
+
+
+class PdfSheetWriter:
+    """Stream QR codes into a multi-page PDF, a grid of codes per page.
+
+    Each page is written out as soon as it fills up, so memory use does not
+    grow with the number of codes.
+    """
+
+    def __init__(self, path, cell_size=None, page_size=None, margin=None, gap=None):
+        self.width, self.height = page_size or SHEET_PAGE_SIZE
+        self.cell_size = cell_size or SHEET_CELL_SIZE
+        self.margin = SHEET_MARGIN if margin is None else margin
+        self.gap = SHEET_GAP if gap is None else gap
+        self.pitch = self.cell_size + self.gap
+        self.columns = max(
+            1, int((self.width - 2 * self.margin + self.gap) // self.pitch)
+        )
+        self.rows = max(1, int((self.height - 2 * self.margin + self.gap) // self.pitch))
+
+        self.file = open(path, "wb")
+        self.offsets = {}
+        self.page_ids = []
+        self.next_id = 3  # 1 is the catalog, 2 the page tree
+        self.cells = []
+        self.file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, size, ops):
+        """Place a code from ``pdf_fragment`` in the next free cell."""
+        index = len(self.cells)
+        x = self.margin + (index % self.columns) * self.pitch
+        y = self.height - self.margin - self.cell_size - (index // self.columns) * self.pitch
+        scale = self.cell_size / size
+        self.cells.append(
+            b"q %.4f 0 0 %.4f %.2f %.2f cm\n%s\nf\nQ\n" % (scale, scale, x, y, ops)
+        )
+        if len(self.cells) == self.columns * self.rows:
+            self._write_page()
+
+    def _write_object(self, number, body):
+        self.offsets[number] = self.file.tell()
+        self.file.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+
+    def _write_page(self):
+        if not self.cells:
+            return
+        content = zlib.compress(b"0 g\n" + b"".join(self.cells))
+        content_id, page_id = self.next_id, self.next_id + 1
+        self.next_id += 2
+        self._write_object(
+            content_id,
+            b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream"
+            % (len(content), content),
+        )
+        self._write_object(
+            page_id,
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Contents %d 0 R /Resources << >> >>"
+            % (self.width, self.height, content_id),
+        )
+        self.page_ids.append(page_id)
+        self.cells = []
+
+    def close(self):
+        if self.file.closed:
             return
+        self._write_page()
+        kids = b" ".join(b"%d 0 R" % page_id for page_id in self.page_ids)
+        self._write_object(
+            2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self.page_ids))
+        )
+        self._write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+
+        xref_offset = self.file.tell()
+        self.file.write(b"xref\n0 %d\n0000000000 65535 f \n" % self.next_id)
+        for number in range(1, self.next_id):
+            self.file.write(b"%010d 00000 n \n" % self.offsets[number])
+        self.file.write(
+            b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (self.next_id, xref_offset)
+        )
+        self.file.close()
+
+
+def save_code(qr_code, path, kind, scale=SAVE_SCALE, border=BULK_BORDER):
+    """Save one code as a 1-bit PNG or, straight from segno, SVG/EPS/PDF.
+
+    ``scale`` is pixels per module for PNG and user units (px for SVG,
+    points for EPS/PDF) per module for the vector formats. A PNG at scale 1
+    is the most compact raster; printers can scale it up losslessly.
+    """
+    if kind == "png":
+        with open(path, "wb") as f:
+            write_mono_png(f, qr_code, scale, border)
+    else:
+        qr_code.save(path, kind=kind, scale=scale, border=border)
+
+
+def save_codes(codes, path, kind, scale=SAVE_SCALE, border=BULK_BORDER):
+    """Save several codes, e.g. a structured append sequence.
+
+    With ``kind`` ``SHEET`` they share one multi-page PDF at ``path``;
+    otherwise each gets its own file, numbered when there is more than one.
+
+    Returns:
+        The paths written.
+    """
+    if kind == SHEET:
+        with PdfSheetWriter(path) as sheet:
+            for qr_code in codes:
+                sheet.add(*pdf_fragment(qr_code, border))
+        return [path]
+
+    paths = [path]
+    if len(codes) > 1:
+        stem, ext = os.path.splitext(path)
+        paths = [f"{stem}-{n}{ext}" for n in range(1, len(codes) + 1)]
+    for code_path, qr_code in zip(paths, codes):
+        save_code(qr_code, code_path, kind, scale, border)
+    return paths
+
+
+def _encode(index, text, error):
+    """Encode record ``index``, naming it in any error."""
+    try:
+        return segno.make(text, error=error, micro=False)
+    except ValueError as e:
+        raise ValueError(f"Record {index + 1}: {e}") from e
+
+
+def _save_batch(batch, kind, output_dir, error, scale, border):
+    """Encode and save a batch of ``(index, stem, text)`` records.
+
+    Returns:
+        The number of files written.
+    """
+    written = 0
+    for index, stem, text in batch:
+        path = os.path.join(output_dir, f"{stem}.{kind}")
+        save_code(_encode(index, text, error), path, kind, scale, border)
+        written += 1
+    return written
+
+
+def _sheet_batch(batch, error, border):
+    """Encode a batch of records into ``pdf_fragment`` results."""
+    return [
+        pdf_fragment(_encode(index, text, error), border) for index, _, text in batch
+    ]
+
+
+def _unique_stems(records):
+    """Yield ``(stem, text)`` for ``records``, each with its own file stem.
+
+    A stem that is already taken, e.g. by a repeated name, gets the record
+    index appended. Stems are compared case-insensitively, as they are on
+    macOS and Windows file systems.
+    """
+    used = set()
+    for index, (name, text) in enumerate(records):
+        stem = base = output_name(index, name)
+        number = index
+        while stem.lower() in used:
+            stem = f"{base}-{number:06d}"
+            number += 1
+        used.add(stem.lower())
+        yield stem, text
+
 
+def _iter_batches(records, batch_size):
+    batch = []
+    for index, (name, text) in enumerate(records):
+        batch.append((index, name, text))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _map_bounded(fn, batches, workers, *args):
+    """Yield ``fn(batch, *args)`` in order, across ``workers`` processes.
+
+    Unlike ``Executor.map``, batches are only pulled from the iterator as
+    results are consumed, keeping ``workers * TASKS_PER_WORKER`` in flight.
+    """
+    if workers <= 1:
+        for batch in batches:
+            yield fn(batch, *args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
         try:
-            # Generate QR code
-            qr_code = segno.make(text, error="h")  # High error correction
+            for batch in batches:
+                pending.append(executor.submit(fn, batch, *args))
+                if len(pending) >= workers * TASKS_PER_WORKER:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(cancel_futures=True)
 
-            # Convert to image
-            # Create a temporary PNG in memory
-            import io
 
-            buffer = io.BytesIO()
-            qr_code.save(buffer, kind="png", scale=10)
+def generate_bulk(
+    records,
+    output,
+    kind="png",
+    error="h",
+    scale=BULK_SCALE,
+    border=BULK_BORDER,
+    workers=None,
+    batch_size=BULK_BATCH_SIZE,
+):
+    """Encode many records as QR codes across a process pool.
 
-            # Load the image from buffer to QImage
-            qimg = QImage()
-            qimg.loadFromData(buffer.getvalue())
+    Records are consumed lazily and only a bounded number of batches is in
+    flight; apart from the set of file names in use, memory does not grow
+    with the input size. Records that share a name get the record index
+    appended, so no file is overwritten. Stop iterating to cancel.
 
-            # Convert to pixmap and display
-            self.qr_image = QPixmap.fromImage(qimg)
-            self.qr_label.setPixmap(
-                self.qr_image.scaled(
-                    300, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
+    Args:
+        records: Iterable of ``(name, text)`` pairs, e.g. from ``iter_records``.
+        output: Output directory, or the PDF file for ``SHEET``.
+        kind: One of ``BULK_FORMATS``.
+        error: segno error correction level.
+        scale: Size of a module in output files, see ``save_code``.
+        border: Quiet zone in modules.
+        workers: Number of processes (default: one per CPU).
+        batch_size: Records encoded per worker task.
+
+    Yields:
+        The total number of codes written so far, after each batch.
+
+    Raises:
+        ValueError: A record does not fit in a QR code; the message gives
+            its 1-based record number.
+    """
+    if kind not in BULK_FORMATS:
+        raise ValueError(f"Unsupported format: {kind}")
+    workers = workers or os.cpu_count() or 1
+    written = 0
+
+    if kind == SHEET:
+        batches = _iter_batches(records, batch_size)
+        with PdfSheetWriter(output) as sheet:
+            for codes in _map_bounded(_sheet_batch, batches, workers, error, border):
+                for size, ops in codes:
+                    sheet.add(size, ops)
+                written += len(codes)
+                yield written
+    else:
+        os.makedirs(output, exist_ok=True)
+        batches = _iter_batches(_unique_stems(records), batch_size)
+        for count in _map_bounded(
+            _save_batch, batches, workers, kind, output, error, scale, border
+        ):
+            written += count
+            yield written
+
+
+class RateMeter:
+    """Track codes per second for progress reports."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.last_report = self.started
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def rate(self, count):
+        elapsed = self.elapsed()
+        return count / elapsed if elapsed > 0 else 0.0
+
+    def due(self):
+        """Return True at most once per ``REPORT_INTERVAL``."""
+        now = time.monotonic()
+        if now - self.last_report < REPORT_INTERVAL:
+            return False
+        self.last_report = now
+        return True
+
+
+def setup_gui():
+    """Set up and return the PyQt5 GUI components."""
+    from PyQt5.QtWidgets import (
+        QApplication,
+        QWidget,
+        QLabel,
+        QTextEdit,
+        QPushButton,
+        QVBoxLayout,
+        QHBoxLayout,
+        QFileDialog,
+        QMessageBox,
+        QComboBox,
+        QCheckBox,
+        QSpinBox,
+    )
+    from PyQt5.QtGui import QPixmap, QImage
+    from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+
+    def mono_image(qr_code, size):
+        """Return ``qr_code`` as a ``size`` x ``size`` 1-bit ``QImage``."""
+        size, bytes_per_line, data = mono_bitmap(qr_code, size)
+        image = QImage(data, size, size, bytes_per_line, QImage.Format_Mono)
+        image.setColorTable([0xFFFFFFFF, 0xFF000000])
+        # Detach from ``data``, which is freed when this function returns
+        return image.copy()
+
+    class PreviewWorker(QThread):
+        """Encode live previews off the UI thread.
+
+        Only the newest request is kept: requests submitted while an encode
+        is running replace each other, so at most one stale encode runs.
+        """
+
+        ready = pyqtSignal(int, object, object, str)
+
+        def __init__(self):
+            super().__init__()
+            self.condition = threading.Condition()
+            self.request = None
+            self.stopping = False
+
+        def submit(self, generation, text, min_error, max_version):
+            with self.condition:
+                self.request = (generation, text, min_error, max_version)
+                self.condition.notify()
+
+        def stop(self):
+            with self.condition:
+                self.stopping = True
+                self.condition.notify()
+            self.wait()
+
+        def run(self):
+            while True:
+                with self.condition:
+                    while self.request is None and not self.stopping:
+                        self.condition.wait()
+                    if self.stopping:
+                        return
+                    generation, text, min_error, max_version = self.request
+                    self.request = None
+                try:
+                    plan = optimize_qr(text, min_error, max_version)
+                    image = mono_image(plan.codes[0], PREVIEW_SIZE)
+                except Exception as e:
+                    self.ready.emit(generation, None, None, str(e))
+                else:
+                    self.ready.emit(generation, plan, image, "")
+
+    class BulkWorker(QThread):
+        progress = pyqtSignal(str)
+        finished_bulk = pyqtSignal(str)
+        error = pyqtSignal(str)
+
+        def __init__(self, input_path, output, kind):
+            super().__init__()
+            self.input_path = input_path
+            self.output = output
+            self.kind = kind
+
+        def run(self):
+            meter = RateMeter()
+            written = 0
+            try:
+                for written in generate_bulk(
+                    iter_records(self.input_path), self.output, self.kind
+                ):
+                    if self.isInterruptionRequested():
+                        self.finished_bulk.emit(f"Cancelled after {written} QR codes")
+                        return
+                    if meter.due():
+                        self.progress.emit(
+                            f"{written} codes ({meter.rate(written):.0f} codes/s)"
+                        )
+            except Exception as e:
+                self.error.emit(str(e))
+                return
+            self.finished_bulk.emit(
+                f"Generated {written} QR codes in {meter.elapsed():.1f}s "
+                f"({meter.rate(written):.0f} codes/s)"
             )
 
-            self.save_button.setEnabled(True)
-            self.status_label.setText("QR Code generated successfully!")
+    class QRGeneratorApp(QWidget):
+        def __init__(self):
+            super().__init__()
+            self.qr_image = None
+            self.qr_plan = None
+            self.bulk_worker = None
+            self.preview_generation = 0
+            self.preview_worker = PreviewWorker()
+            self.preview_worker.ready.connect(self.show_preview)
+            self.preview_worker.start()
+            self.init_ui()
 
-        except Exception as e:
-            QMessageBox.critical(
-                self, "Error", f"Failed to generate QR code:\n{str(e)}"
+        def init_ui(self):
+            self.setWindowTitle("QR Code Generator")
+            self.setGeometry(300, 300, 500, 600)
+
+            # Create layout
+            layout = QVBoxLayout()
+
+            # Input label
+            input_label = QLabel("Enter text to encode:")
+            layout.addWidget(input_label)
+
+            # Text input area
+            self.text_input = QTextEdit()
+            self.text_input.setFixedHeight(100)
+            self.text_input.textChanged.connect(self.schedule_preview)
+            layout.addWidget(self.text_input)
+
+            # Live preview, re-encoded once typing pauses
+            self.live_checkbox = QCheckBox("Live preview")
+            self.live_checkbox.setChecked(True)
+            self.live_checkbox.toggled.connect(self.schedule_preview)
+            layout.addWidget(self.live_checkbox)
+            self.preview_timer = QTimer(self)
+            self.preview_timer.setSingleShot(True)
+            self.preview_timer.setInterval(PREVIEW_DEBOUNCE)
+            self.preview_timer.timeout.connect(self.request_preview)
+
+            # Encoding settings for the optimizer
+            options_layout = QHBoxLayout()
+            self.error_combo = QComboBox()
+            self.error_combo.addItems([level.upper() for level in ERROR_LEVELS])
+            self.error_combo.setCurrentText(DEFAULT_MIN_ERROR.upper())
+            self.error_combo.currentTextChanged.connect(self.schedule_preview)
+            options_layout.addWidget(QLabel("Min error level:"))
+            options_layout.addWidget(self.error_combo)
+            self.max_version_spinbox = QSpinBox()
+            self.max_version_spinbox.setRange(0, 40)
+            self.max_version_spinbox.setSpecialValueText("Any")
+            self.max_version_spinbox.setToolTip(
+                "Split larger payloads into a structured append sequence"
             )
+            self.max_version_spinbox.valueChanged.connect(self.schedule_preview)
+            options_layout.addWidget(QLabel("Max version:"))
+            options_layout.addWidget(self.max_version_spinbox)
+            layout.addLayout(options_layout)
 
-    def save_qr(self):
-        if self.qr_image is None:
-            return
+            # Generate button
+            self.generate_button = QPushButton("Generate QR Code")
+            self.generate_button.clicked.connect(self.generate_qr)
+            layout.addWidget(self.generate_button)
 
-        options = QFileDialog.Options()
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Save QR Code",
-            "",
-            "PNG Files (*.png);;All Files (*)",
-            options=options,
-        )
+            # QR code display label
+            self.qr_label = QLabel()
+            self.qr_label.setAlignment(Qt.AlignCenter)
+            self.qr_label.setMinimumSize(PREVIEW_SIZE, PREVIEW_SIZE)
+            self.qr_label.setStyleSheet("border: 1px solid gray;")
+            layout.addWidget(self.qr_label)
+
+            # Save button
+            self.save_button = QPushButton("Save QR Code")
+            self.save_button.clicked.connect(self.save_qr)
+            self.save_button.setEnabled(False)  # Initially disabled
+            layout.addWidget(self.save_button)
+
+            # Bulk generation from a CSV or JSON-lines file
+            bulk_layout = QHBoxLayout()
+            self.bulk_format_combo = QComboBox()
+            self.bulk_format_combo.addItems(BULK_FORMATS)
+            bulk_layout.addWidget(QLabel("Bulk format:"))
+            bulk_layout.addWidget(self.bulk_format_combo)
+            self.bulk_button = QPushButton("Bulk Generate...")
+            self.bulk_button.clicked.connect(self.bulk_generate)
+            bulk_layout.addWidget(self.bulk_button)
+            self.bulk_cancel_button = QPushButton("Cancel")
+            self.bulk_cancel_button.clicked.connect(self.cancel_bulk)
+            self.bulk_cancel_button.setEnabled(False)
+            bulk_layout.addWidget(self.bulk_cancel_button)
+            layout.addLayout(bulk_layout)
+
+            # Status label
+            self.status_label = QLabel("")
+            layout.addWidget(self.status_label)
+
+            self.setLayout(layout)
+
+        def generate_qr(self):
+            text = self.text_input.toPlainText().strip()
+
+            if not text:
+                QMessageBox.warning(self, "Warning", "Please enter some text to encode.")
+                return
+
+            # Supersede any live preview still being encoded
+            self.preview_generation += 1
 
-        if file_path:
             try:
-                # Save the image
-                if not self.qr_image.save(file_path):
-                    raise Exception("Failed to save image")
+                # Generate the smallest QR code meeting the settings
+                plan = optimize_qr(text, *self.encode_settings())
+
+                # Render the module matrix straight into a 1-bit image
+                self.qr_plan = plan
+                self.qr_image = QPixmap.fromImage(mono_image(plan.codes[0], PREVIEW_SIZE))
+                self.qr_label.setPixmap(self.qr_image)
+
+                self.save_button.setEnabled(True)
+                self.status_label.setText(
+                    f"QR Code generated successfully! {plan.describe()}"
+                )
 
-                self.status_label.setText(f"QR Code saved to {file_path}")
             except Exception as e:
                 QMessageBox.critical(
-                    self, "Error", f"Failed to save QR code:\n{str(e)}"
+                    self, "Error", f"Failed to generate QR code:\n{str(e)}"
                 )
 
+        def encode_settings(self):
+            max_version = self.max_version_spinbox.value() or None
+            return self.error_combo.currentText().lower(), max_version
+
+        def schedule_preview(self):
+            if self.live_checkbox.isChecked():
+                self.preview_timer.start()
+
+        def request_preview(self):
+            # Newer requests make any in-flight result stale
+            self.preview_generation += 1
+            text = self.text_input.toPlainText().strip()
+            if not text:
+                self.qr_plan = self.qr_image = None
+                self.qr_label.clear()
+                self.save_button.setEnabled(False)
+                self.status_label.setText("")
+                return
+            self.preview_worker.submit(
+                self.preview_generation, text, *self.encode_settings()
+            )
+
+        def show_preview(self, generation, plan, image, message):
+            if generation != self.preview_generation:
+                return
+            if plan is None:
+                self.status_label.setText(f"Cannot encode: {message}")
+                return
+            self.qr_plan = plan
+            self.qr_image = QPixmap.fromImage(image)
+            self.qr_label.setPixmap(self.qr_image)
+            self.save_button.setEnabled(True)
+            self.status_label.setText(plan.describe())
+
+        def closeEvent(self, event):
+            self.preview_worker.stop()
+            if self.bulk_worker is not None:
+                self.bulk_worker.requestInterruption()
+                self.bulk_worker.wait()
+            super().closeEvent(event)
+
+        def save_qr(self):
+            if self.qr_image is None:
+                return
+
+            options = QFileDialog.Options()
+            file_path, selected_filter = QFileDialog.getSaveFileName(
+                self,
+                "Save QR Code",
+                "",
+                ";;".join(SAVE_FILTERS),
+                options=options,
+            )
+
+            if file_path:
+                try:
+                    # Save straight from the module matrix, one file per
+                    # symbol of a sequence unless they go on a PDF sheet
+                    kind, scale = SAVE_FILTERS.get(selected_filter, ("png", SAVE_SCALE))
+                    if not os.path.splitext(file_path)[1]:
+                        file_path += ".pdf" if kind == SHEET else f".{kind}"
+                    paths = save_codes(self.qr_plan.codes, file_path, kind, scale)
+
+                    self.status_label.setText(f"QR Code saved to {', '.join(paths)}")
+                except Exception as e:
+                    QMessageBox.critical(
+                        self, "Error", f"Failed to save QR code:\n{str(e)}"
+                    )
+
+        def bulk_generate(self):
+            input_path, _ = QFileDialog.getOpenFileName(
+                self,
+                "Select Records",
+                "",
+                "Records (*.csv *.jsonl *.ndjson);;All Files (*)",
+            )
+            if not input_path:
+                return
+
+            kind = self.bulk_format_combo.currentText()
+            if kind == SHEET:
+                output, _ = QFileDialog.getSaveFileName(
+                    self, "Save QR Sheet", "", "PDF Files (*.pdf)"
+                )
+            else:
+                output = QFileDialog.getExistingDirectory(self, "Select Output Directory")
+            if not output:
+                return
+
+            self.bulk_worker = BulkWorker(input_path, output, kind)
+            self.bulk_worker.progress.connect(self.status_label.setText)
+            self.bulk_worker.finished_bulk.connect(self.bulk_finished)
+            self.bulk_worker.error.connect(self.bulk_failed)
+            self.bulk_button.setEnabled(False)
+            self.bulk_cancel_button.setEnabled(True)
+            self.status_label.setText("Generating QR codes...")
+            self.bulk_worker.start()
+
+        def cancel_bulk(self):
+            if self.bulk_worker is not None:
+                self.bulk_worker.requestInterruption()
+
+        def bulk_finished(self, message):
+            self.bulk_button.setEnabled(True)
+            self.bulk_cancel_button.setEnabled(False)
+            self.status_label.setText(message)
+
+        def bulk_failed(self, message):
+            self.bulk_finished("")
+            QMessageBox.critical(
+                self, "Error", f"Failed to generate QR codes:\n{message}"
+            )
+
+    return QApplication(sys.argv), QRGeneratorApp()
+
+
+def run_bulk(args):
+    """Generate QR codes from ``args.bulk``, printing progress to stderr."""
+    output = args.output
+    if output is None:
+        stem = os.path.splitext(os.path.basename(args.bulk))[0]
+        output = f"{stem}.pdf" if args.format == SHEET else stem
+
+    meter = RateMeter()
+    written = 0
+    try:
+        for written in generate_bulk(
+            iter_records(args.bulk, args.column),
+            output,
+            args.format,
+            args.error,
+            args.scale,
+            workers=args.workers,
+        ):
+            if meter.due():
+                print(
+                    f"{written} codes ({meter.rate(written):.0f} codes/s)",
+                    file=sys.stderr,
+                )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"Generated {written} QR codes in {meter.elapsed():.1f}s "
+        f"({meter.rate(written):.0f} codes/s)"
+    )
+    print(f"Output: {output}")
+
 
 def main():
-    app = QApplication(sys.argv)
-    window = QRGeneratorApp()
-    window.show()
-    sys.exit(app.exec_())
+    parser = argparse.ArgumentParser(
+        description="Generate QR codes with a GUI, or in bulk from the command line."
+    )
+    parser.add_argument(
+        "--cli",
+        action="store_true",
+        help="Run in command-line mode instead of GUI mode.",
+    )
+    parser.add_argument(
+        "--bulk",
+        default=None,
+        help="CSV or JSON-lines file of records to encode (required in CLI mode).",
+    )
+    parser.add_argument(
+        "--column",
+        default=None,
+        help='Field holding the text to encode (default: first CSV column, or "text").',
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help=f"Output directory, or PDF file for --format {SHEET} (default: named after the input).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=BULK_FORMATS,
+        default="png",
+        help=f"Output format, one file per code; {SHEET} writes one multi-page PDF (default: png).",
+    )
+    parser.add_argument(
+        "--error",
+        choices=["l", "m", "q", "h"],
+        default="h",
+        help="Error correction level (default: h).",
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=BULK_SCALE,
+        help=f"Pixels (PNG, SVG) or points (EPS, PDF) per module; 1 gives the most compact PNGs (default: {BULK_SCALE}).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of encoding processes (default: one per CPU).",
+    )
+
+    args = parser.parse_args()
+
+    if args.cli:
+        if not args.bulk:
+            print("Error: --bulk is required in CLI mode.", file=sys.stderr)
+            sys.exit(1)
+        run_bulk(args)
+    else:
+        app, window = setup_gui()
+        window.show()
+        sys.exit(app.exec_())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+
+import pymupdf
+
+import convert_pdf
+
+
+def make_text_pdf(path, pages=20):
+    """Write a text-only PDF whose pages all share one embedded font."""
+    font = pymupdf.Font("tiro").buffer
+    with pymupdf.open() as doc:
+        for number in range(pages):
+            page = doc.new_page()
+            page.insert_font(fontname="shared", fontbuffer=font)
+            page.insert_text((72, 72), f"Page {number}", fontname="shared")
+        doc.save(path, garbage=4, deflate=True)
+
+
+def make_bilevel_scan_pdf(path, dpi=200):
+    """Write a one-page PDF holding a 1-bit Flate scan of a page of text."""
+    with pymupdf.open() as source:
+        text_page = source.new_page()
+        for y in range(50, 780, 14):
+            text_page.insert_text((40, y), "Lorem ipsum dolor sit amet " * 3)
+        pix = text_page.get_pixmap(dpi=dpi, colorspace=pymupdf.csGRAY)
+
+    # PDF's DeviceGray has 0 as black, so dark pixels become 0 bits
+    to_bits = bytes(b"0"[0] if value < 128 else b"1"[0] for value in range(256))
+    samples = pix.samples
+    row_bytes = -(-pix.width // 8)
+    rows = []
+    for y in range(pix.height):
+        bits = samples[y * pix.width : (y + 1) * pix.width].translate(to_bits)
+        rows.append(int(bits.ljust(row_bytes * 8, b"1"), 2).to_bytes(row_bytes, "big"))
+
+    placeholder = pymupdf.Pixmap(pymupdf.csGRAY, pymupdf.IRect(0, 0, 1, 1), False)
+    with pymupdf.open() as doc:
+        page = doc.new_page()
+        xref = page.insert_image(page.rect, pixmap=placeholder)
+        doc.update_object(
+            xref,
+            f"<< /Type /XObject /Subtype /Image /Width {pix.width} "
+            f"/Height {pix.height} /ColorSpace /DeviceGray /BitsPerComponent 1 >>",
+        )
+        doc.update_stream(xref, b"".join(rows))
+        doc.save(path, garbage=4, deflate=True)
+
+
+class PassthroughTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.temp_dir.name, "text.pdf")
+        self.output_path = os.path.join(self.temp_dir.name, "text_converted.pdf")
+        make_text_pdf(self.input_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def assert_not_larger(self, **kwargs):
+        kept = convert_pdf.convert_with_pymupdf(
+            self.input_path, self.output_path, 150, passthrough=True, **kwargs
+        )
+        self.assertEqual(kept, 20)
+        self.assertLessEqual(
+            os.path.getsize(self.output_path), os.path.getsize(self.input_path)
+        )
+
+    def test_shared_font_copied_once(self):
+        self.assert_not_larger()
+
+    def test_shared_font_copied_once_across_chunks(self):
+        self.assert_not_larger(workers=2, chunk_pages=4)
+
+    def test_target_size_counts_kept_pages(self):
+        density, quality, predicted = convert_pdf.choose_settings_for_size(
+            self.input_path, 2 * os.path.getsize(self.input_path), passthrough=True
+        )
+        convert_pdf.convert_with_pymupdf(
+            self.input_path, self.output_path, density, quality, passthrough=True
+        )
+        actual = os.path.getsize(self.output_path)
+        self.assertAlmostEqual(predicted, actual, delta=actual * 0.1)
+
+    def test_unreachable_target_size(self):
+        with self.assertRaisesRegex(convert_pdf.ConversionError, "smallest achievable"):
+            convert_pdf.choose_settings_for_size(
+                self.input_path, 10_000, passthrough=True
+            )
+
+    def test_bilevel_scan_not_larger(self):
+        make_bilevel_scan_pdf(self.input_path)
+        with pymupdf.open(self.input_path) as doc:
+            self.assertEqual(
+                convert_pdf.classify_page(doc[0], 150), convert_pdf.PAGE_PASSTHROUGH
+            )
+        convert_pdf.convert_with_pymupdf(
+            self.input_path, self.output_path, 150, passthrough=True
+        )
+        self.assertLessEqual(
+            os.path.getsize(self.output_path), os.path.getsize(self.input_path)
+        )
+
+
+class CancelTest(unittest.TestCase):
+    def test_cancel_keeps_earlier_output(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, "text.pdf")
+            output_path = os.path.join(temp_dir, "text_converted.pdf")
+            make_text_pdf(input_path)
+            with open(output_path, "wb") as f:
+                f.write(b"earlier run")
+
+            with self.assertRaises(convert_pdf.ConversionCancelled):
+                convert_pdf.convert_pdf_file(
+                    input_path, output_path, 150, cancelled=lambda: True
+                )
+            with open(output_path, "rb") as f:
+                self.assertEqual(f.read(), b"earlier run")
+            self.assertEqual(
+                sorted(os.listdir(temp_dir)), ["text.pdf", "text_converted.pdf"]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+import pymupdf
+
+import pdf_to_images
+
+
+def make_inherited_image_pdf(path, color):
+    """Write a one-page PDF that draws a ``color`` image through resources
+    inherited from the page tree rather than set on the page."""
+    pix = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 4, 4), False)
+    pix.set_rect(pix.irect, color)
+    with pymupdf.open() as doc:
+        page = doc.new_page()
+        page.insert_image(page.rect, pixmap=pix)
+        _, resources = doc.xref_get_key(page.xref, "Resources")
+        _, parent = doc.xref_get_key(page.xref, "Parent")
+        doc.xref_set_key(int(parent.split()[0]), "Resources", resources)
+        doc.xref_set_key(page.xref, "Resources", "null")
+        doc.save(path)
+
+
+def make_linked_pdf(path, pages, last_text="last"):
+    """Write a PDF whose every page links to the next one."""
+    with pymupdf.open() as doc:
+        for number in range(pages):
+            page = doc.new_page()
+            text = last_text if number == pages - 1 else f"Page {number}"
+            page.insert_text((72, 72), text)
+        for page in doc:
+            target = (page.number + 1) % pages
+            page.insert_link(
+                {
+                    "kind": pymupdf.LINK_GOTO,
+                    "from": pymupdf.Rect(72, 60, 200, 80),
+                    "page": target,
+                    "to": pymupdf.Point(0, 0),
+                }
+            )
+        doc.save(path, garbage=4, deflate=True)
+
+
+def page_keys(path):
+    with pymupdf.open(path) as doc:
+        return [pdf_to_images.page_cache_key(page, 72) for page in doc]
+
+
+class PageCacheKeyTest(unittest.TestCase):
+    def test_inherited_resources_are_hashed(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            keys = []
+            for name, color in [("red", (255, 0, 0)), ("blue", (0, 0, 255))]:
+                path = os.path.join(temp_dir, f"{name}.pdf")
+                make_inherited_image_pdf(path, color)
+                with pymupdf.open(path) as doc:
+                    page = doc[0]
+                    self.assertEqual(
+                        doc.xref_get_key(page.xref, "Resources")[0], "null"
+                    )
+                    keys.append(pdf_to_images.page_cache_key(page, 72))
+            self.assertNotEqual(keys[0], keys[1])
+
+    def test_linked_pages_are_not_hashed(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            original = os.path.join(temp_dir, "original.pdf")
+            edited = os.path.join(temp_dir, "edited.pdf")
+            make_linked_pdf(original, 20)
+            make_linked_pdf(edited, 20, last_text="edited")
+
+            before, after = page_keys(original), page_keys(edited)
+            self.assertEqual(before[:-1], after[:-1])
+            self.assertNotEqual(before[-1], after[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
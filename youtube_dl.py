@@ -5,87 +5,585 @@
 #     "yt-dlp",
 # ]
 # ///
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
 import sys
-from threading import Thread
-
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal
-from PyQt5.QtWidgets import (
-    QApplication,
-    QCheckBox,
-    QComboBox,
-    QFormLayout,
-    QGroupBox,
-    QLabel,
-    QLineEdit,
-    QMainWindow,
-    QPushButton,
-    QTextEdit,
-    QVBoxLayout,
-    QWidget,
-)
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import RotatingFileHandler
+from threading import BoundedSemaphore, Lock, Thread, get_ident
+
 from yt_dlp import YoutubeDL
+from yt_dlp.utils import PostProcessingError, format_bytes, formatSeconds, parse_bytes
+
+
+class DownloadCache:
+    """Persistent playlist cache and download archive.
+
+    Extracted playlist listings are stored as JSON files keyed by URL and
+    reused until they are ``ttl`` seconds old, so re-queued and overlapping
+    playlists skip extraction; see ``cacheable``. The archive records every
+    downloaded video id so yt-dlp skips items that were already fetched.
+    """
+
+    def __init__(self, cache_dir=None, ttl=None):
+        self.cache_dir = cache_dir or CACHE_DIR_DEFAULT
+        self.ttl = CACHE_TTL_DEFAULT if ttl is None else ttl
+        self.archive_path = os.path.join(self.cache_dir, "archive.txt")
+        os.makedirs(os.path.join(self.cache_dir, "info"), exist_ok=True)
+
+    @staticmethod
+    def cacheable(info):
+        """Whether an unprocessed info dict is safe to replay later.
+
+        Only playlists whose entries are unresolved URL references qualify.
+        A video's info carries media URLs that expire within hours.
+        """
+        return info.get("_type") == "playlist" and all(
+            not entry or entry.get("_type") in ("url", "url_transparent")
+            for entry in info["entries"]
+        )
+
+    def info_path(self, url):
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, "info", f"{key}.info.json")
+
+    def lookup(self, url):
+        """Return the cached info dict for ``url`` if it is fresh, or None."""
+        path = self.info_path(url)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl:
+                return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, url, info):
+        """Save a sanitized info dict for ``url`` and return its path."""
+        path = self.info_path(url)
+        temp_path = f"{path}.{get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(info, f)
+        os.replace(temp_path, path)
+        return path
+
+
+class DeferredYoutubeDL(YoutubeDL):
+    """``YoutubeDL`` that runs post-processing on a ``PostProcessPool``.
+
+    Each video's format merge and fixups are submitted to ``pool`` as soon
+    as that video's download finishes, so ffmpeg works on one playlist
+    entry while the next one downloads. The playlist stage
+    (``FFmpegConcat``) first waits for the entries, then is submitted too.
+    Videos are added to the download archive only once their
+    post-processing has succeeded, so a failed merge is retried on the next
+    run. ``wait`` collects whatever is still pending.
+    """
+
+    def __init__(self, params=None, pool=None):
+        super().__init__(params)
+        self.pool = pool
+        self.pending = []  # (info, future) in submission order
+        self.archive_deferred = set()  # archive ids recorded by their job
+
+    def post_process(self, filename, info, files_to_move=None):
+        info["filepath"] = filename
+        archive_id = None
+        if self.params.get("download_archive"):
+            archive_id = self._make_archive_id(info)
+            self.archive_deferred.add(archive_id)
+        # yt-dlp keeps updating ``info`` after this returns, so the job
+        # works on a copy and ``wait`` applies the result
+        future = self.pool.submit(
+            self._post_process, filename, dict(info), files_to_move, archive_id
+        )
+        self.pending.append((info, future))
+        return info
+
+    def _post_process(self, filename, info, files_to_move, archive_id):
+        try:
+            info = super().post_process(filename, info, files_to_move)
+        except PostProcessingError as e:
+            self.report_error(f"Postprocessing: {e}")
+            return None
+        if archive_id is not None:
+            super().record_download_archive(info)
+        return info
+
+    def record_download_archive(self, info_dict):
+        archive_id = self._make_archive_id(info_dict)
+        if archive_id in self.archive_deferred:
+            self.archive_deferred.discard(archive_id)
+            return
+        super().record_download_archive(info_dict)
+
+    def run_all_pps(self, key, info, *, additional_pps=None):
+        if key != "playlist":
+            return super().run_all_pps(key, info, additional_pps=additional_pps)
+        # Concatenation needs every entry's final file
+        self.wait()
+        future = self.pool.submit(self._run_playlist_pps, dict(info))
+        self.pending.append((info, future))
+        return info
+
+    def _run_playlist_pps(self, info):
+        try:
+            return super().run_all_pps("playlist", info)
+        except PostProcessingError as e:
+            self.report_error(f"Postprocessing: {e}")
+            return None
+
+    def wait(self):
+        """Wait for the pending post-processing and return the yt-dlp retcode."""
+        pending, self.pending = self.pending, []
+        for info, future in pending:
+            new_info = future.result()
+            # Entries are referenced by their playlist, so update in place
+            if new_info is not None:
+                info.clear()
+                info.update(new_info)
+        return self._download_retcode
+
+
+class PostProcessPool:
+    """Bounded thread pool for deferred post-processing.
+
+    ffmpeg does the work in a subprocess, so threads are enough to overlap
+    it with downloads. ``submit`` blocks once ``workers + queue_depth``
+    items are pending, which stalls downloads instead of piling up
+    unmerged files.
+    """
+
+    def __init__(self, workers=None, queue_depth=None):
+        self.workers = workers or POSTPROCESS_WORKERS_DEFAULT
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="postprocess"
+        )
+        if queue_depth is None:
+            queue_depth = POSTPROCESS_QUEUE_DEFAULT
+        self.slots = BoundedSemaphore(self.workers + queue_depth)
+        self.lock = Lock()
+        self.pending = 0
+
+    def submit(self, fn, *args):
+        self.slots.acquire()
+        with self.lock:
+            self.pending += 1
+        future = self.executor.submit(fn, *args)
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future):
+        with self.lock:
+            self.pending -= 1
+        self.slots.release()
+
+    @property
+    def queue_depth(self):
+        """Number of items waiting for a free worker."""
+        return max(0, self.pending - self.workers)
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+
+def build_performance(
+    preset=None,
+    fragments=None,
+    chunk_size=None,
+    rate_limit=None,
+    downloader=None,
+    ffmpeg_threads=None,
+):
+    """Build throughput parameters from a preset in ``PERFORMANCE_PRESETS``.
+
+    Args:
+        preset: Name of the base performance preset, None for the default.
+        fragments: Fragments of HLS/DASH streams fetched in parallel.
+        chunk_size: HTTP chunk size in bytes, 0 to download in one request.
+        rate_limit: Maximum download rate in bytes per second, 0 for none.
+        downloader: External downloader name, or ``DOWNLOADER_NATIVE``.
+        ffmpeg_threads: Threads for each ffmpeg post-processing run, 0 or
+            None to let ffmpeg decide.
+
+    Returns:
+        Dict of ``YoutubeDL`` parameters to layer over a quality preset.
+    """
+    params = PERFORMANCE_PRESETS[preset or PERFORMANCE_DEFAULT].copy()
+    if fragments:
+        params["concurrent_fragment_downloads"] = fragments
+    if chunk_size is not None:
+        params["http_chunk_size"] = chunk_size
+    if not params.get("http_chunk_size"):
+        params.pop("http_chunk_size", None)
+    if rate_limit:
+        params["ratelimit"] = rate_limit
+    if downloader and downloader != DOWNLOADER_NATIVE:
+        params["external_downloader"] = {"default": downloader}
+    if ffmpeg_threads:
+        params["postprocessor_args"] = {"ffmpeg": ["-threads", str(ffmpeg_threads)]}
+    return params
+
+
+def available_downloaders():
+    """Return the native downloader plus any external ones found on PATH."""
+    return [DOWNLOADER_NATIVE] + [
+        name for name in EXTERNAL_DOWNLOADERS if shutil.which(name)
+    ]
+
+
+def build_params(
+    download_config,
+    write_subs=False,
+    logger=None,
+    cache=None,
+    performance=None,
+    verbose=False,
+):
+    """Build ``YoutubeDL`` parameters from a preset in ``OPTIONS``.
+
+    ``performance`` is layered on top of the quality preset; see
+    ``build_performance``. With ``verbose``, yt-dlp also emits its
+    ``[debug]`` messages to the logger.
+    """
+    params = OPTIONS.get(download_config, OPTION_480P).copy()
+    params.update(build_performance() if performance is None else performance)
+    if logger is not None:
+        params["logger"] = logger
+    if verbose:
+        params["verbose"] = True
+
+    # Skip videos already recorded in the archive
+    if cache is not None:
+        params["download_archive"] = cache.archive_path
+
+    # Add subtitle option if selected
+    if write_subs:
+        params["writeautomaticsub"] = True
+        params["subtitlesformat"] = "srt"
+
+    return params
+
+
+def run_download(url, params, cache=None, postprocess=None, on_downloaded=None):
+    """Download ``url`` with ``params``.
+
+    With a ``cache``, a fresh cached playlist listing is replayed instead of
+    extracting the URL again. Otherwise the URL is extracted once without
+    resolving its entries, and the result is cached if
+    ``DownloadCache.cacheable`` allows it before it is downloaded.
+
+    With a ``postprocess`` pool, each video's merge is queued on it as soon
+    as the video is downloaded, and ``on_downloaded`` is called once every
+    download is done so the caller can start its next one while the last
+    merges and the concatenation finish.
+
+    Returns:
+        An error message if some items failed, otherwise None.
+    """
+    if postprocess is None:
+        ydl = YoutubeDL(params)
+    else:
+        ydl = DeferredYoutubeDL(params, postprocess)
+    with ydl:
+        try:
+            if cache is None:
+                retcode = ydl.download([url])
+            else:
+                info = cache.lookup(url)
+                if info is None:
+                    info = ydl.extract_info(url, download=False, process=False)
+                    if info is None:
+                        return "Could not extract video information"
+                    if info.get("_type") == "playlist":
+                        info["entries"] = list(info.get("entries") or [])
+                    if cache.cacheable(info):
+                        cache.store(url, ydl.sanitize_info(info))
+                ydl.process_ie_result(info, download=True)
+                retcode = ydl._download_retcode
+        except BaseException:
+            # Queued jobs still use ydl, so let them finish before it closes
+            if postprocess is not None:
+                ydl.wait()
+            raise
+        if postprocess is not None:
+            if on_downloaded is not None:
+                on_downloaded()
+            retcode = ydl.wait() or retcode
+        if retcode != 0:
+            return "Some items failed to download"
+    return None
+
+
+def progress_fields(d):
+    """Pick the fields worth reporting from a yt-dlp progress hook dict."""
+    return {
+        "status": d.get("status"),
+        "filename": d.get("filename"),
+        "downloaded_bytes": d.get("downloaded_bytes"),
+        "total_bytes": d.get("total_bytes") or d.get("total_bytes_estimate"),
+        "speed": d.get("speed"),
+        "eta": d.get("eta"),
+        "fragment_index": d.get("fragment_index"),
+        "fragment_count": d.get("fragment_count"),
+    }
 
 
-class LogSignal(QObject):
-    log_signal = pyqtSignal(str)
+class ProgressThrottle:
+    """yt-dlp progress hook that forwards ``progress_fields`` to ``callback``.
+
+    yt-dlp calls its hooks for every chunk received, so "downloading"
+    updates are forwarded at most once per ``interval`` seconds. Other
+    statuses always go through.
+    """
+
+    def __init__(self, callback, interval=None):
+        self.callback = callback
+        self.interval = PROGRESS_INTERVAL if interval is None else interval
+        self.last_update = 0.0
+
+    def __call__(self, d):
+        now = time.monotonic()
+        if d.get("status") == "downloading" and now - self.last_update < self.interval:
+            return
+        self.last_update = now
+        self.callback(progress_fields(d))
 
 
 class AsyncTask(Thread):
-    def __init__(self, url, download_config, log_signal, write_subs=False):
+    def __init__(
+        self,
+        url,
+        download_config,
+        signals,
+        log,
+        write_subs=False,
+        cache=None,
+        performance=None,
+        debug=False,
+        postprocess=None,
+    ):
         super().__init__()
 
         self.html = None
         self.url = url
         self.download_config = download_config
-        self.log_signal = log_signal
+        self.signals = signals
+        self.log = log
         self.write_subs = write_subs
+        self.cache = cache
+        self.performance = performance
+        self.debug = debug
+        self.postprocess = postprocess
+        self.error = None
 
     def run(self):
-        # Custom logger class to emit signals to the GUI
+        # Custom logger class to hand messages to the GUI's log buffer
         class Logger:
-            def __init__(self, log_signal):
-                self.log_signal = log_signal
+            def __init__(self, log, debug):
+                self.log = log
+                self.capture_debug = debug
 
             def debug(self, msg):
-                self.log_signal.log_signal.emit(f"DEBUG: {msg}")
+                # yt-dlp routes info messages here too; only true debug
+                # messages are optional
+                if self.capture_debug or not msg.startswith("[debug] "):
+                    self.log(f"DEBUG: {msg}")
 
             def warning(self, msg):
-                self.log_signal.log_signal.emit(f"WARNING: {msg}")
+                self.log(f"WARNING: {msg}")
 
             def error(self, msg):
-                self.log_signal.log_signal.emit(f"ERROR: {msg}")
+                self.log(f"ERROR: {msg}")
 
-        logger_instance = Logger(self.log_signal)
+        logger_instance = Logger(self.log, self.debug)
 
-        params = OPTIONS.get(self.download_config, OPTION_480P).copy()
-        params["logger"] = logger_instance
+        params = build_params(
+            self.download_config,
+            self.write_subs,
+            logger_instance,
+            self.cache,
+            self.performance,
+            verbose=self.debug,
+        )
+        params["progress_hooks"] = [ProgressThrottle(self.signals.progress_signal.emit)]
 
-        # Add subtitle option if selected
-        if self.write_subs:
-            params["writeautomaticsub"] = True
-            params["subtitlesformat"] = "srt"
+        try:
+            self.error = run_download(
+                self.url,
+                params,
+                self.cache,
+                self.postprocess,
+                self.signals.postprocessing_signal.emit,
+            )
+        except Exception as e:
+            self.error = str(e)
+            self.log(f"ERROR: {self.error}")
+        self.signals.finished_signal.emit()
 
-        print(params)
 
-        with YoutubeDL(params) as ydl:
-            ydl.download([self.url])
+STATUS_QUEUED = "Queued"
+STATUS_RUNNING = "Running"
+STATUS_PROCESSING = "Processing"
+STATUS_DONE = "Done"
+STATUS_FAILED = "Failed"
 
 
-class LoadingHandler:
-    def __init__(self):
-        _in_progress = ["-", "\\", "|", "/"]
-        self.loading_text = [f"Loading... {x}" for x in _in_progress]
+class DownloadJob:
+    """One queued URL with its settings, status, progress and captured log."""
 
-    @property
-    def initial_state(self):
-        return self.loading_text[0]
+    def __init__(
+        self,
+        url,
+        download_config,
+        write_subs=False,
+        cache=None,
+        performance=None,
+        log_lines=None,
+    ):
+        self.url = url
+        self.download_config = download_config
+        self.write_subs = write_subs
+        self.cache = cache
+        self.performance = performance
+        self.status = STATUS_QUEUED
+        self.log = deque(maxlen=log_lines or LOG_LINES_DEFAULT)
+        self.task = None
+        self.error = None
+
+        # Progress of the current file and totals over finished files
+        self.progress = None
+        self.files_done = 0
+        self.bytes_done = 0
+        self.started_at = None
+        self.downloaded_at = None
+        self.finished_at = None
+
+    def mark_started(self):
+        self.status = STATUS_RUNNING
+        self.started_at = time.monotonic()
 
-    def next(self, state=None):
-        if state in self.loading_text:
-            index = self.loading_text.index(state)
-            return self.loading_text[(index + 1) % len(self.loading_text)]
+    def mark_postprocessing(self):
+        self.status = STATUS_PROCESSING
+        self.progress = None
+        self.downloaded_at = time.monotonic()
+
+    def mark_finished(self, error=None):
+        self.error = error
+        self.status = STATUS_FAILED if error else STATUS_DONE
+        self.finished_at = time.monotonic()
+
+    def update_progress(self, progress):
+        """Fold a ``progress_fields`` dict into the job's totals."""
+        if progress["status"] == "finished":
+            self.files_done += 1
+            self.bytes_done += (
+                progress["total_bytes"] or progress["downloaded_bytes"] or 0
+            )
+            self.progress = None
         else:
-            return self.loading_text[0]
+            self.progress = progress
+
+    @property
+    def downloaded_bytes(self):
+        current = self.progress["downloaded_bytes"] if self.progress else None
+        return self.bytes_done + (current or 0)
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def average_speed(self):
+        """Average download speed, not counting time spent post-processing."""
+        if self.started_at is None:
+            return None
+        end = self.downloaded_at or self.finished_at or time.monotonic()
+        duration = end - self.started_at
+        return self.downloaded_bytes / duration if duration else None
+
+    def totals(self):
+        """Return the job's totals for reporting."""
+        return {
+            "files": self.files_done,
+            "bytes": self.downloaded_bytes,
+            "elapsed": round(self.elapsed, 3),
+            "average_speed": self.average_speed,
+        }
+
+
+class LogBuffer:
+    """Thread-safe inbox for log lines from download threads.
+
+    Download threads ``put`` lines as they arrive and the GUI ``drain``s
+    them in batches on a timer, instead of one cross-thread signal and one
+    widget update per line. Lines are also written to ``mirror`` (a
+    ``logging.Logger``) when one is set.
+    """
+
+    def __init__(self, mirror=None):
+        self.mirror = mirror
+        self.lock = Lock()
+        self.pending = []
+
+    def put(self, job, message):
+        mirror = self.mirror
+        if mirror is not None:
+            mirror.info("%s %s", job.url, message)
+        with self.lock:
+            self.pending.append((job, message))
+
+    def drain(self):
+        """Return and clear the ``(job, message)`` pairs received so far."""
+        with self.lock:
+            pending, self.pending = self.pending, []
+        return pending
+
+
+def open_log_mirror(path, max_bytes=None, backups=None):
+    """Return a logger that writes to ``path``, rotating it at ``max_bytes``."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    mirror = logging.getLogger("youtube_dl.mirror")
+    mirror.setLevel(logging.INFO)
+    mirror.propagate = False
+    close_log_mirror(mirror)
+    handler = RotatingFileHandler(
+        path,
+        maxBytes=max_bytes or LOG_FILE_MAX_BYTES,
+        backupCount=LOG_FILE_BACKUPS if backups is None else backups,
+        encoding="utf-8",
+    )
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    mirror.addHandler(handler)
+    return mirror
+
+
+def close_log_mirror(mirror):
+    for handler in list(mirror.handlers):
+        mirror.removeHandler(handler)
+        handler.close()
+
+
+def parse_urls(text):
+    """Split pasted text or a URL list file into URLs.
+
+    Blank lines and lines starting with ``#`` are ignored; any whitespace
+    separates URLs.
+    """
+    urls = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            urls.extend(line.split())
+    return urls
 
 
 OPTION_480P = {
@@ -153,114 +651,734 @@ OPTIONS = {
 }
 OPTION_DEFAULT = "480p"
 
+# Throughput settings, layered on top of any quality preset
+PERF_STANDARD = {
+    "concurrent_fragment_downloads": 1,
+}
+
+PERF_FAST = {
+    "concurrent_fragment_downloads": 4,
+    "http_chunk_size": 10 * 1024 * 1024,
+}
+
+PERF_MAX = {
+    "concurrent_fragment_downloads": 16,
+    "http_chunk_size": 10 * 1024 * 1024,
+}
+
+PERFORMANCE_PRESETS = {
+    "standard": PERF_STANDARD,
+    "fast": PERF_FAST,
+    "max": PERF_MAX,
+}
+PERFORMANCE_DEFAULT = "standard"  # matches yt-dlp's own defaults; faster presets are opt-in
+
+DOWNLOADER_NATIVE = "native"
+EXTERNAL_DOWNLOADERS = ["aria2c", "axel", "curl", "wget"]
+
 LOADING_INFO_DEFAULT = "Waiting..."
+CONCURRENCY_DEFAULT = 3
+PROGRESS_INTERVAL = 0.25  # seconds between progress updates per download
+QUEUE_COLUMNS = ["URL", "Status", "Progress", "Downloaded", "Speed", "ETA"]
 
+POSTPROCESS_WORKERS_DEFAULT = 2
+POSTPROCESS_QUEUE_DEFAULT = 4  # merges waiting before downloads stall
+FFMPEG_THREADS_DEFAULT = 0  # let ffmpeg decide
 
-class YouTubeDownloaderApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
+LOG_LINES_DEFAULT = 5000  # log lines kept per download
+LOG_FLUSH_INTERVAL = 200  # milliseconds between log display updates
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
 
-        self.setWindowTitle("YouTube Downloader")
-        self.setGeometry(100, 100, 600, 400)
-
-        # Create central widget and layout
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        main_layout = QVBoxLayout(central_widget)
-
-        # Create form layout for inputs
-        form_group = QGroupBox("Download Settings")
-        form_layout = QFormLayout(form_group)
-
-        # URL input
-        self.url_input = QLineEdit("<enter url here>")
-        form_layout.addRow("URL:", self.url_input)
-
-        # Download config combo
-        self.download_config_combo = QComboBox()
-        self.download_config_combo.addItems(list(OPTIONS.keys()))
-        self.download_config_combo.setCurrentText(OPTION_DEFAULT)
-        form_layout.addRow("Quality:", self.download_config_combo)
-
-        # Subtitles checkbox
-        self.subtitles_checkbox = QCheckBox("Download Subtitles")
-        self.subtitles_checkbox.setChecked(False)
-        form_layout.addRow("", self.subtitles_checkbox)
-
-        # Add form group to main layout
-        main_layout.addWidget(form_group)
-
-        # Button to run job
-        self.run_button = QPushButton("Run Job")
-        self.run_button.clicked.connect(self.run_job)
-        main_layout.addWidget(self.run_button)
-
-        # Loading info label
-        self.loading_label = QLabel(LOADING_INFO_DEFAULT)
-        main_layout.addWidget(self.loading_label)
-
-        # Log display
-        self.log_display = QTextEdit()
-        self.log_display.setReadOnly(True)
-        main_layout.addWidget(QLabel("Log:"))
-        main_layout.addWidget(self.log_display)
-
-        # Timer for loading animation
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_loading_animation)
-        self.current_loading_state = None
-
-        # Loading handler
-        self.loading_handler = LoadingHandler()
-
-        # Log signal for thread communication
-        self.log_signal = LogSignal()
-        self.log_signal.log_signal.connect(self.append_log)
-
-    def run_job(self):
-        # Disable button and update label
-        self.run_button.setEnabled(False)
-        self.run_button.setText("Job is Running...")
-
-        # Start loading animation
-        self.current_loading_state = self.loading_handler.initial_state
-        self.loading_label.setText(self.current_loading_state)
-        self.timer.start(125)  # Update every 125ms
-
-        # Create and start download thread
-        url = self.url_input.text()
-        config = self.download_config_combo.currentText()
-        write_subs = self.subtitles_checkbox.isChecked()
-        self.job = AsyncTask(url, config, self.log_signal, write_subs)
-        self.job.start()
-
-        # Check periodically if job is still running
-        self.check_job_status()
-
-    def check_job_status(self):
-        if hasattr(self.job, "is_alive") and self.job.is_alive():
-            # Continue checking
-            QTimer.singleShot(500, self.check_job_status)  # Check every 500ms
-        else:
-            # Job finished
-            self.timer.stop()
-            self.loading_label.setText(LOADING_INFO_DEFAULT)
-            self.run_button.setEnabled(True)
-            self.run_button.setText("Run Job")
-
-    def update_loading_animation(self):
-        if self.current_loading_state:
-            self.current_loading_state = self.loading_handler.next(
-                self.current_loading_state
+CACHE_DIR_DEFAULT = os.path.join(
+    os.path.expanduser("~"), ".cache", "stubby", "youtube_dl"
+)
+CACHE_TTL_DEFAULT = 36 * 3600  # seconds; outlasts the gap between nightly re-syncs
+LOG_FILE_DEFAULT = os.path.join(CACHE_DIR_DEFAULT, "youtube_dl.log")
+
+
+def setup_gui():
+    """Set up and return the PyQt5 GUI components."""
+    from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+    from PyQt5.QtWidgets import (
+        QAbstractItemView,
+        QApplication,
+        QCheckBox,
+        QComboBox,
+        QFileDialog,
+        QFormLayout,
+        QGroupBox,
+        QHeaderView,
+        QLabel,
+        QMainWindow,
+        QPlainTextEdit,
+        QProgressBar,
+        QPushButton,
+        QSpinBox,
+        QTableWidget,
+        QTableWidgetItem,
+        QVBoxLayout,
+        QWidget,
+    )
+
+    class JobSignals(QObject):
+        progress_signal = pyqtSignal(object)
+        postprocessing_signal = pyqtSignal()
+        finished_signal = pyqtSignal()
+
+    class YouTubeDownloaderApp(QMainWindow):
+        def __init__(self):
+            super().__init__()
+
+            self.setWindowTitle("YouTube Downloader")
+            self.setGeometry(100, 100, 700, 600)
+
+            # Create central widget and layout
+            central_widget = QWidget()
+            self.setCentralWidget(central_widget)
+            main_layout = QVBoxLayout(central_widget)
+
+            # Create form layout for inputs
+            form_group = QGroupBox("Download Settings")
+            form_layout = QFormLayout(form_group)
+
+            # URL input, one or more URLs per line
+            self.url_input = QPlainTextEdit()
+            self.url_input.setPlaceholderText("<enter urls here, one per line>")
+            self.url_input.setFixedHeight(80)
+            form_layout.addRow("URLs:", self.url_input)
+
+            # Load URLs from a file
+            self.load_file_button = QPushButton("Load URLs from File...")
+            self.load_file_button.clicked.connect(self.load_url_file)
+            form_layout.addRow("", self.load_file_button)
+
+            # Download config combo
+            self.download_config_combo = QComboBox()
+            self.download_config_combo.addItems(list(OPTIONS.keys()))
+            self.download_config_combo.setCurrentText(OPTION_DEFAULT)
+            form_layout.addRow("Quality:", self.download_config_combo)
+
+            # Subtitles checkbox
+            self.subtitles_checkbox = QCheckBox("Download Subtitles")
+            self.subtitles_checkbox.setChecked(False)
+            form_layout.addRow("", self.subtitles_checkbox)
+
+            # Number of simultaneous downloads
+            self.concurrency_spinbox = QSpinBox()
+            self.concurrency_spinbox.setRange(1, 16)
+            self.concurrency_spinbox.setValue(CONCURRENCY_DEFAULT)
+            form_layout.addRow("Parallel Downloads:", self.concurrency_spinbox)
+
+            # Metadata cache and download archive
+            self.cache_checkbox = QCheckBox(
+                "Reuse cached playlist listings and skip already-downloaded videos"
             )
-            self.loading_label.setText(self.current_loading_state)
+            self.cache_checkbox.setChecked(False)
+            form_layout.addRow("", self.cache_checkbox)
+
+            # Add form group to main layout
+            main_layout.addWidget(form_group)
+
+            # Throughput settings, applied to each queued download
+            perf_group = QGroupBox("Performance")
+            perf_layout = QFormLayout(perf_group)
+
+            self.performance_combo = QComboBox()
+            self.performance_combo.addItems(list(PERFORMANCE_PRESETS.keys()))
+            perf_layout.addRow("Preset:", self.performance_combo)
+
+            self.fragments_spinbox = QSpinBox()
+            self.fragments_spinbox.setRange(1, 32)
+            perf_layout.addRow("Parallel Fragments:", self.fragments_spinbox)
+
+            self.chunk_size_spinbox = QSpinBox()
+            self.chunk_size_spinbox.setRange(0, 1024)
+            self.chunk_size_spinbox.setSuffix(" MB")
+            self.chunk_size_spinbox.setSpecialValueText("Off")
+            perf_layout.addRow("HTTP Chunk Size:", self.chunk_size_spinbox)
+
+            self.rate_limit_spinbox = QSpinBox()
+            self.rate_limit_spinbox.setRange(0, 1024 * 1024)
+            self.rate_limit_spinbox.setSingleStep(256)
+            self.rate_limit_spinbox.setSuffix(" KB/s")
+            self.rate_limit_spinbox.setSpecialValueText("Unlimited")
+            perf_layout.addRow("Rate Limit:", self.rate_limit_spinbox)
+
+            self.downloader_combo = QComboBox()
+            self.downloader_combo.addItems(available_downloaders())
+            perf_layout.addRow("Downloader:", self.downloader_combo)
+
+            # Merges and concatenation run on their own bounded pool
+            self.postprocess_workers_spinbox = QSpinBox()
+            self.postprocess_workers_spinbox.setRange(1, 16)
+            self.postprocess_workers_spinbox.setValue(POSTPROCESS_WORKERS_DEFAULT)
+            perf_layout.addRow("Post-processing Workers:", self.postprocess_workers_spinbox)
+
+            self.postprocess_queue_spinbox = QSpinBox()
+            self.postprocess_queue_spinbox.setRange(0, 64)
+            self.postprocess_queue_spinbox.setValue(POSTPROCESS_QUEUE_DEFAULT)
+            perf_layout.addRow("Post-processing Queue:", self.postprocess_queue_spinbox)
+
+            self.ffmpeg_threads_spinbox = QSpinBox()
+            self.ffmpeg_threads_spinbox.setRange(0, 64)
+            self.ffmpeg_threads_spinbox.setSpecialValueText("Auto")
+            self.ffmpeg_threads_spinbox.setValue(FFMPEG_THREADS_DEFAULT)
+            perf_layout.addRow("FFmpeg Threads:", self.ffmpeg_threads_spinbox)
+
+            self.performance_combo.currentTextChanged.connect(
+                self.apply_performance_preset
+            )
+            self.performance_combo.setCurrentText(PERFORMANCE_DEFAULT)
+            self.apply_performance_preset(PERFORMANCE_DEFAULT)
+
+            main_layout.addWidget(perf_group)
+
+            # Log capture settings
+            log_group = QGroupBox("Logging")
+            log_layout = QFormLayout(log_group)
+
+            self.log_lines_spinbox = QSpinBox()
+            self.log_lines_spinbox.setRange(100, 1000000)
+            self.log_lines_spinbox.setSingleStep(1000)
+            self.log_lines_spinbox.setValue(LOG_LINES_DEFAULT)
+            self.log_lines_spinbox.valueChanged.connect(self.set_log_lines)
+            log_layout.addRow("Max Log Lines:", self.log_lines_spinbox)
+
+            self.debug_checkbox = QCheckBox("Capture yt-dlp debug messages")
+            self.debug_checkbox.setChecked(False)
+            log_layout.addRow("", self.debug_checkbox)
+
+            self.mirror_checkbox = QCheckBox(f"Mirror log to {LOG_FILE_DEFAULT}")
+            self.mirror_checkbox.setChecked(False)
+            self.mirror_checkbox.toggled.connect(self.set_log_mirror)
+            log_layout.addRow("", self.mirror_checkbox)
+
+            main_layout.addWidget(log_group)
+
+            # Button to queue the entered URLs
+            self.run_button = QPushButton("Add to Queue")
+            self.run_button.clicked.connect(self.run_job)
+            main_layout.addWidget(self.run_button)
+
+            # Queue summary and combined throughput
+            self.loading_label = QLabel(LOADING_INFO_DEFAULT)
+            main_layout.addWidget(self.loading_label)
+
+            # Download queue, one row per URL
+            self.queue_table = QTableWidget(0, len(QUEUE_COLUMNS))
+            self.queue_table.setHorizontalHeaderLabels(QUEUE_COLUMNS)
+            self.queue_table.horizontalHeader().setSectionResizeMode(
+                0, QHeaderView.Stretch
+            )
+            self.queue_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+            self.queue_table.setSelectionMode(QAbstractItemView.SingleSelection)
+            self.queue_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+            self.queue_table.itemSelectionChanged.connect(self.show_selected_log)
+            main_layout.addWidget(QLabel("Queue:"))
+            main_layout.addWidget(self.queue_table)
+
+            # Log display for the selected download
+            self.log_display = QPlainTextEdit()
+            self.log_display.setReadOnly(True)
+            self.log_display.setMaximumBlockCount(LOG_LINES_DEFAULT)
+            main_layout.addWidget(QLabel("Log (selected download):"))
+            main_layout.addWidget(self.log_display)
+
+            # Raising the limit starts more queued downloads right away
+            self.concurrency_spinbox.valueChanged.connect(self.check_job_status)
+
+            self.jobs = []
+            self.cache = None
+            self.pool = None
+            self.pool_settings = None
+
+            # Log lines from download threads, shown in batches
+            self.log_buffer = LogBuffer()
+            self.log_timer = QTimer()
+            self.log_timer.timeout.connect(self.flush_logs)
+            self.log_timer.start(LOG_FLUSH_INTERVAL)
+
+        def load_url_file(self):
+            file_path, _ = QFileDialog.getOpenFileName(
+                self, "Select URL List", "", "Text Files (*.txt);;All Files (*)"
+            )
+            if file_path:
+                with open(file_path) as f:
+                    self.enqueue(parse_urls(f.read()))
+
+        def apply_performance_preset(self, preset):
+            params = PERFORMANCE_PRESETS[preset]
+            self.fragments_spinbox.setValue(
+                params.get("concurrent_fragment_downloads", 1)
+            )
+            self.chunk_size_spinbox.setValue(
+                params.get("http_chunk_size", 0) // (1024 * 1024)
+            )
+
+        def performance(self):
+            return build_performance(
+                self.performance_combo.currentText(),
+                fragments=self.fragments_spinbox.value(),
+                chunk_size=self.chunk_size_spinbox.value() * 1024 * 1024,
+                rate_limit=self.rate_limit_spinbox.value() * 1024,
+                downloader=self.downloader_combo.currentText(),
+                ffmpeg_threads=self.ffmpeg_threads_spinbox.value(),
+            )
+
+        def postprocess_pool(self):
+            settings = (
+                self.postprocess_workers_spinbox.value(),
+                self.postprocess_queue_spinbox.value(),
+            )
+            # Downloads that have not handed off their work yet still need
+            # the current pool, so only replace it between downloads
+            downloading = any(job.status == STATUS_RUNNING for job in self.jobs)
+            if self.pool is None or (self.pool_settings != settings and not downloading):
+                if self.pool is not None:
+                    self.pool.shutdown(wait=False)
+                self.pool = PostProcessPool(*settings)
+                self.pool_settings = settings
+            return self.pool
+
+        def run_job(self):
+            self.enqueue(parse_urls(self.url_input.toPlainText()))
+            self.url_input.clear()
+
+        def enqueue(self, urls):
+            config = self.download_config_combo.currentText()
+            write_subs = self.subtitles_checkbox.isChecked()
+            performance = self.performance()
+            cache = None
+            if self.cache_checkbox.isChecked():
+                if self.cache is None:
+                    self.cache = DownloadCache()
+                cache = self.cache
+
+            # Skip URLs that are already waiting or downloading
+            active = {
+                job.url
+                for job in self.jobs
+                if job.status in (STATUS_QUEUED, STATUS_RUNNING)
+            }
+            urls = [url for url in dict.fromkeys(urls) if url not in active]
+
+            for url in urls:
+                job = DownloadJob(
+                    url,
+                    config,
+                    write_subs,
+                    cache,
+                    performance,
+                    self.log_lines_spinbox.value(),
+                )
+                self.jobs.append(job)
+                row = self.queue_table.rowCount()
+                self.queue_table.insertRow(row)
+                for column in range(len(QUEUE_COLUMNS)):
+                    self.queue_table.setItem(row, column, QTableWidgetItem())
+                self.queue_table.item(row, 0).setText(url)
+                progress_bar = QProgressBar()
+                progress_bar.setTextVisible(True)
+                self.queue_table.setCellWidget(row, 2, progress_bar)
+                self.update_job_row(job)
+
+            self.check_job_status()
+
+        def start_job(self, job):
+            signals = JobSignals()
+            signals.progress_signal.connect(
+                lambda progress, job=job: self.on_job_progress(job, progress)
+            )
+            signals.postprocessing_signal.connect(
+                lambda job=job: self.on_job_postprocessing(job)
+            )
+            signals.finished_signal.connect(
+                lambda job=job: self.on_job_finished(job)
+            )
+            job.task = AsyncTask(
+                job.url,
+                job.download_config,
+                signals,
+                lambda message, job=job: self.log_buffer.put(job, message),
+                job.write_subs,
+                job.cache,
+                job.performance,
+                self.debug_checkbox.isChecked(),
+                self.postprocess_pool(),
+            )
+            job.mark_started()
+            job.task.start()
+            self.update_job_row(job)
+
+        def on_job_progress(self, job, progress):
+            job.update_progress(progress)
+            self.update_job_row(job)
+            self.update_summary()
+
+        def on_job_postprocessing(self, job):
+            # The download slot is free while ffmpeg works
+            job.mark_postprocessing()
+            self.update_job_row(job)
+            self.check_job_status()
+
+        def on_job_finished(self, job):
+            job.mark_finished(job.task.error)
+            self.update_job_row(job)
+            self.check_job_status()
+
+        def check_job_status(self):
+            # Start queued downloads up to the concurrency limit
+            running = sum(job.status == STATUS_RUNNING for job in self.jobs)
+            for job in self.jobs:
+                if running >= self.concurrency_spinbox.value():
+                    break
+                if job.status == STATUS_QUEUED:
+                    self.start_job(job)
+                    running += 1
+            self.update_summary()
+
+        def update_job_row(self, job):
+            row = self.jobs.index(job)
+            progress = job.progress
+            progress_bar = self.queue_table.cellWidget(row, 2)
+
+            if job.status == STATUS_RUNNING and progress:
+                downloaded = progress["downloaded_bytes"] or 0
+                total = progress["total_bytes"]
+                fragments = ""
+                if progress["fragment_count"]:
+                    fragments = f" (frag {progress['fragment_index']}/{progress['fragment_count']})"
+                if total:
+                    progress_bar.setRange(0, 1000)
+                    progress_bar.setValue(min(1000, int(downloaded * 1000 / total)))
+                    progress_bar.setFormat(f"%p%{fragments}")
+                else:
+                    # Unknown size, show a busy indicator
+                    progress_bar.setRange(0, 0)
+                speed = f"{format_bytes(progress['speed'])}/s" if progress["speed"] else ""
+                eta = formatSeconds(progress["eta"]) if progress["eta"] is not None else ""
+            elif job.status == STATUS_PROCESSING:
+                progress_bar.setRange(0, 0)
+                speed = f"avg {format_bytes(job.average_speed)}/s" if job.average_speed else ""
+                eta = ""
+            elif job.status in (STATUS_DONE, STATUS_FAILED):
+                progress_bar.setRange(0, 1000)
+                progress_bar.setValue(1000 if job.status == STATUS_DONE else 0)
+                progress_bar.setFormat(f"{job.files_done} file(s)")
+                speed = f"avg {format_bytes(job.average_speed)}/s" if job.average_speed else ""
+                eta = formatSeconds(int(job.elapsed))
+            else:
+                progress_bar.setRange(0, 1000)
+                progress_bar.setValue(0)
+                progress_bar.setFormat("%p%")
+                speed = eta = ""
+
+            self.queue_table.item(row, 1).setText(job.status)
+            self.queue_table.item(row, 3).setText(
+                format_bytes(job.downloaded_bytes) if job.downloaded_bytes else ""
+            )
+            self.queue_table.item(row, 4).setText(speed)
+            self.queue_table.item(row, 5).setText(eta)
+
+        def update_summary(self):
+            counts = {
+                status: sum(job.status == status for job in self.jobs)
+                for status in (
+                    STATUS_RUNNING,
+                    STATUS_QUEUED,
+                    STATUS_PROCESSING,
+                    STATUS_DONE,
+                    STATUS_FAILED,
+                )
+            }
+            if not any(counts[s] for s in (STATUS_RUNNING, STATUS_QUEUED, STATUS_PROCESSING)):
+                self.loading_label.setText(LOADING_INFO_DEFAULT)
+                return
+            summary = ", ".join(f"{count} {status.lower()}" for status, count in counts.items())
+            if self.pool is not None and self.pool.queue_depth:
+                summary += f" ({self.pool.queue_depth} waiting for ffmpeg)"
+            speed = sum(
+                job.progress["speed"] or 0
+                for job in self.jobs
+                if job.status == STATUS_RUNNING and job.progress
+            )
+            self.loading_label.setText(f"{summary} - {format_bytes(speed)}/s")
+
+        def selected_job(self):
+            rows = self.queue_table.selectionModel().selectedRows()
+            return self.jobs[rows[0].row()] if rows else None
+
+        def show_selected_log(self):
+            job = self.selected_job()
+            self.log_display.setPlainText("\n".join(job.log) if job else "")
+
+        def flush_logs(self):
+            entries = self.log_buffer.drain()
+            if not entries:
+                return
+            selected = self.selected_job()
+            shown = []
+            for job, message in entries:
+                job.log.append(message)
+                if job is selected:
+                    shown.append(message)
+            if shown:
+                self.log_display.appendPlainText("\n".join(shown))
+
+        def set_log_lines(self, lines):
+            self.log_display.setMaximumBlockCount(lines)
+            for job in self.jobs:
+                job.log = deque(job.log, maxlen=lines)
+
+        def set_log_mirror(self, enabled):
+            if enabled:
+                self.log_buffer.mirror = open_log_mirror(LOG_FILE_DEFAULT)
+            elif self.log_buffer.mirror is not None:
+                close_log_mirror(self.log_buffer.mirror)
+                self.log_buffer.mirror = None
+
+        def closeEvent(self, event):
+            self.set_log_mirror(False)
+            if self.pool is not None:
+                self.pool.shutdown(wait=False)
+            super().closeEvent(event)
+
+    return QApplication(sys.argv), YouTubeDownloaderApp()
+
+
+class JsonLinesReporter:
+    """Write download events to a stream as JSON lines, one object per line."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.lock = Lock()
+
+    def emit(self, event, **fields):
+        line = json.dumps({"event": event, **fields})
+        with self.lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+class JsonLinesLogger:
+    """yt-dlp logger that reports messages as ``log`` events."""
+
+    def __init__(self, reporter, url, verbose=False):
+        self.reporter = reporter
+        self.url = url
+        self.verbose = verbose
+
+    def debug(self, msg):
+        # yt-dlp routes info messages here too; only true debug messages
+        # depend on --verbose
+        if msg.startswith("[debug] "):
+            if self.verbose:
+                self.reporter.emit("log", url=self.url, level="debug", message=msg)
+        else:
+            self.reporter.emit("log", url=self.url, level="info", message=msg)
+
+    def warning(self, msg):
+        self.reporter.emit("log", url=self.url, level="warning", message=msg)
+
+    def error(self, msg):
+        self.reporter.emit("log", url=self.url, level="error", message=msg)
+
+
+def run_cli(args):
+    """Download every URL headlessly, reporting progress as JSON lines.
+
+    Returns:
+        Process exit code.
+    """
+    urls = list(args.urls)
+    if args.batch:
+        with open(args.batch) as f:
+            urls.extend(parse_urls(f.read()))
+    if not urls:
+        print("Error: No URLs given.", file=sys.stderr)
+        return 1
+
+    reporter = JsonLinesReporter()
+    cache = DownloadCache(args.cache_dir, args.cache_ttl) if args.cache else None
+    performance = build_performance(
+        args.performance,
+        fragments=args.fragments,
+        chunk_size=args.chunk_size,
+        rate_limit=args.limit_rate,
+        downloader=args.downloader,
+        ffmpeg_threads=args.ffmpeg_threads,
+    )
+    pool = PostProcessPool(args.postprocess_workers, args.postprocess_queue)
+    # Download slots are held until the post-processing has been queued
+    download_slots = BoundedSemaphore(max(1, args.concurrency))
+
+    def download_one(url):
+        download_slots.acquire()
+        released = False
+        job = DownloadJob(url, args.quality, args.subtitles, cache, performance)
+        job.mark_started()
+        reporter.emit("start", url=url)
+
+        def report_progress(progress):
+            job.update_progress(progress)
+            reporter.emit("progress", url=url, **progress)
+
+        def report_downloaded():
+            nonlocal released
+            job.mark_postprocessing()
+            reporter.emit("postprocessing", url=url, queue_depth=pool.queue_depth)
+            download_slots.release()
+            released = True
+
+        params = build_params(
+            args.quality,
+            args.subtitles,
+            JsonLinesLogger(reporter, url, args.verbose),
+            cache,
+            performance,
+            verbose=args.verbose,
+        )
+        params["noprogress"] = True
+        params["progress_hooks"] = [ProgressThrottle(report_progress)]
+        try:
+            error = run_download(url, params, cache, pool, report_downloaded)
+        except Exception as e:
+            error = str(e)
+        finally:
+            if not released:
+                download_slots.release()
+        job.mark_finished(error)
+        reporter.emit(
+            "finished", url=url, ok=error is None, error=error, **job.totals()
+        )
+        return error is None
+
+    # Enough threads for every download slot plus every post-processing slot
+    threads = max(1, args.concurrency) + pool.workers + args.postprocess_queue
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(download_one, dict.fromkeys(urls)))
+    pool.shutdown()
+    return 0 if all(results) else 1
+
+
+def byte_size(value):
+    """Parse a size such as ``10M`` for argparse."""
+    size = parse_bytes(value)
+    if size is None:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}")
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Download videos with yt-dlp through a GUI or headless CLI."
+    )
+    parser.add_argument(
+        "--cli",
+        action="store_true",
+        help="Run in command-line mode instead of GUI mode (does not load PyQt5).",
+    )
+    parser.add_argument("urls", nargs="*", help="URLs to download (CLI mode).")
+    parser.add_argument(
+        "--batch",
+        default=None,
+        help="File of URLs to download, one per line (CLI mode).",
+    )
+    parser.add_argument(
+        "--quality",
+        choices=list(OPTIONS.keys()),
+        default=OPTION_DEFAULT,
+        help=f"Download preset (default: {OPTION_DEFAULT}).",
+    )
+    parser.add_argument(
+        "--subtitles", action="store_true", help="Download subtitles as SRT."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=CONCURRENCY_DEFAULT,
+        help=f"Number of simultaneous downloads (default: {CONCURRENCY_DEFAULT}).",
+    )
+    parser.add_argument(
+        "--performance",
+        choices=list(PERFORMANCE_PRESETS.keys()),
+        default=PERFORMANCE_DEFAULT,
+        help=f"Throughput preset (default: {PERFORMANCE_DEFAULT}).",
+    )
+    parser.add_argument(
+        "--fragments",
+        type=int,
+        default=None,
+        help="Fragments of HLS/DASH streams to download in parallel.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=byte_size,
+        default=None,
+        help="HTTP chunk size, e.g. 10M; 0 disables chunking.",
+    )
+    parser.add_argument(
+        "--limit-rate",
+        type=byte_size,
+        default=None,
+        help="Maximum download rate in bytes per second, e.g. 2M.",
+    )
+    parser.add_argument(
+        "--downloader",
+        choices=[DOWNLOADER_NATIVE] + EXTERNAL_DOWNLOADERS,
+        default=DOWNLOADER_NATIVE,
+        help="External downloader to hand files to (default: native).",
+    )
+    parser.add_argument(
+        "--postprocess-workers",
+        type=int,
+        default=POSTPROCESS_WORKERS_DEFAULT,
+        help=f"Simultaneous merge/concat jobs (default: {POSTPROCESS_WORKERS_DEFAULT}).",
+    )
+    parser.add_argument(
+        "--postprocess-queue",
+        type=int,
+        default=POSTPROCESS_QUEUE_DEFAULT,
+        help=f"Finished downloads allowed to wait for post-processing (default: {POSTPROCESS_QUEUE_DEFAULT}).",
+    )
+    parser.add_argument(
+        "--ffmpeg-threads",
+        type=int,
+        default=FFMPEG_THREADS_DEFAULT,
+        help="Threads per ffmpeg run (default: let ffmpeg decide).",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse cached playlist listings and skip videos in the download archive.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=CACHE_DIR_DEFAULT,
+        help=f"Directory for the info cache and download archive (default: {CACHE_DIR_DEFAULT}).",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=CACHE_TTL_DEFAULT,
+        help=f"Seconds before a cached playlist listing is re-extracted; new playlist items show up after this (default: {CACHE_TTL_DEFAULT}).",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Include yt-dlp [debug] messages in the JSON-lines output; info messages are always included.",
+    )
+
+    args = parser.parse_args()
 
-    def append_log(self, message):
-        self.log_display.append(message)
+    if args.cli:
+        sys.exit(run_cli(args))
+    else:
+        app, window = setup_gui()
+        window.show()
+        sys.exit(app.exec_())
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = YouTubeDownloaderApp()
-    window.show()
-    sys.exit(app.exec_())
+    main()